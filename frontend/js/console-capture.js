@@ -0,0 +1,72 @@
+/**
+ * Console capture - Records browser console output for window.getConsoleLogs().
+ *
+ * Only active when debugging is enabled via ?debug in the URL or
+ * localStorage.setItem('SLOPSTAG_DEBUG', 'true'); otherwise the console
+ * methods are left untouched.
+ */
+(function() {
+    if (window._consoleCaptured) return;
+    window._consoleCaptured = true;
+
+    const debugEnabled = new URLSearchParams(window.location.search).has('debug') ||
+        localStorage.getItem('SLOPSTAG_DEBUG') === 'true';
+    if (!debugEnabled) {
+        window.getConsoleLogs = () => [];
+        return;
+    }
+
+    // Fixed-size ring buffer; _logHead counts all entries ever written
+    const maxLogs = 200;
+    window._consoleLogs = new Array(maxLogs);
+    window._logHead = 0;
+
+    const originalConsole = {
+        log: console.log.bind(console),
+        warn: console.warn.bind(console),
+        error: console.error.bind(console),
+        info: console.info.bind(console)
+    };
+
+    // Arguments are stored as-is and only stringified when logs are read
+    function formatEntry(entry) {
+        return {
+            level: entry.level,
+            timestamp: new Date(entry.timestamp).toISOString(),
+            message: entry.rawArgs.map(arg => {
+                try {
+                    if (typeof arg === 'object') return JSON.stringify(arg);
+                    return String(arg);
+                } catch (e) {
+                    return String(arg);
+                }
+            }).join(' ')
+        };
+    }
+
+    function captureLog(level, args) {
+        const entry = { level: level, timestamp: Date.now(), rawArgs: args };
+        window._consoleLogs[window._logHead % maxLogs] = entry;
+        window._logHead++;
+    }
+
+    console.log = function(...args) { captureLog('log', args); originalConsole.log(...args); };
+    console.warn = function(...args) { captureLog('warn', args); originalConsole.warn(...args); };
+    console.error = function(...args) { captureLog('error', args); originalConsole.error(...args); };
+    console.info = function(...args) { captureLog('info', args); originalConsole.info(...args); };
+
+    window.getConsoleLogs = function(clear = false) {
+        const logs = [];
+        const start = Math.max(0, window._logHead - maxLogs);
+        for (let i = start; i < window._logHead; i++) {
+            logs.push(formatEntry(window._consoleLogs[i % maxLogs]));
+        }
+        if (clear) {
+            window._consoleLogs = new Array(maxLogs);
+            window._logHead = 0;
+        }
+        return logs;
+    };
+
+    console.log('Console capture initialized');
+})();
@@ -179,6 +179,10 @@ export class EffectRenderer {
      * @param {Object} expansion - Canvas expansion
      */
     renderSingleEffect(ctx, layer, effect, expansion) {
+        // Effects only paint with source-atop/destination-over, so a fully
+        // transparent effect is a no-op
+        if (effect.opacity <= 0) return;
+
         ctx.save();
         ctx.globalAlpha = effect.opacity;
 
@@ -7,6 +7,9 @@ from nicegui import app, ui
 from starlette.middleware.base import BaseHTTPMiddleware
 from fastapi import APIRouter
 from fastapi.responses import JSONResponse
+from fastapi.staticfiles import StaticFiles
+
+from slopstag.config import settings
 
 
 class NoCacheMiddleware(BaseHTTPMiddleware):
@@ -15,14 +18,28 @@ class NoCacheMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request, call_next):
         response = await call_next(request)
         # Disable caching for JS/CSS files
-        if any(request.url.path.endswith(ext) for ext in ('.js', '.css')):
+        if request.url.path.endswith(('.js', '.css')):
             response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate'
             response.headers['Pragma'] = 'no-cache'
             response.headers['Expires'] = '0'
         return response
 
 
-app.add_middleware(NoCacheMiddleware)
+class RevalidatingStaticFiles(StaticFiles):
+    """Static files that browsers revalidate via ETag/Last-Modified.
+
+    Frontend assets are not fingerprinted, so they must not be cached
+    blindly; revalidation turns repeat loads into 304 responses.
+    """
+
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
+
+
+if settings.DEV:
+    app.add_middleware(NoCacheMiddleware)
 
 # Import and mount FastAPI backend
 from slopstag.app import create_api_app
@@ -34,56 +51,7 @@ app.mount("/api", api_app)
 
 # Serve frontend static files
 FRONTEND_DIR = Path(__file__).parent / "frontend"
-app.add_static_files("/static", FRONTEND_DIR)
-
-# Console capture JavaScript - injected into page
-CONSOLE_CAPTURE_JS = """
-(function() {
-    if (window._consoleCaptured) return;
-    window._consoleCaptured = true;
-    window._consoleLogs = [];
-    const maxLogs = 200;
-
-    const originalConsole = {
-        log: console.log.bind(console),
-        warn: console.warn.bind(console),
-        error: console.error.bind(console),
-        info: console.info.bind(console)
-    };
-
-    function captureLog(level, args) {
-        const entry = {
-            level: level,
-            timestamp: new Date().toISOString(),
-            message: Array.from(args).map(arg => {
-                try {
-                    if (typeof arg === 'object') return JSON.stringify(arg);
-                    return String(arg);
-                } catch (e) {
-                    return String(arg);
-                }
-            }).join(' ')
-        };
-        window._consoleLogs.push(entry);
-        if (window._consoleLogs.length > maxLogs) {
-            window._consoleLogs.shift();
-        }
-    }
-
-    console.log = function(...args) { captureLog('log', args); originalConsole.log(...args); };
-    console.warn = function(...args) { captureLog('warn', args); originalConsole.warn(...args); };
-    console.error = function(...args) { captureLog('error', args); originalConsole.error(...args); };
-    console.info = function(...args) { captureLog('info', args); originalConsole.info(...args); };
-
-    window.getConsoleLogs = function(clear = false) {
-        const logs = [...window._consoleLogs];
-        if (clear) window._consoleLogs = [];
-        return logs;
-    };
-
-    console.log('Console capture initialized');
-})();
-"""
+app.mount("/static", RevalidatingStaticFiles(directory=FRONTEND_DIR))
 
 # Debug router for console access
 debug_router = APIRouter(prefix="/debug", tags=["debug"])
@@ -142,8 +110,8 @@ async def index(mode: str = None):
         })();
     </script>''')
 
-    # Inject console capture script
-    ui.add_head_html(f'<script>{CONSOLE_CAPTURE_JS}</script>')
+    # Console capture script (served as a static file so browsers cache it)
+    ui.add_head_html('<script src="/static/js/console-capture.js"></script>')
 
     # Create the canvas editor component - it handles everything
     editor = CanvasEditor(width=800, height=600, api_base="/api").classes("w-full h-full")
@@ -161,7 +129,7 @@ async def index(mode: str = None):
                 print(f"[{level}] {timestamp}: {message}")
             print("============================\n")
         else:
-            print("No console logs to fetch")
+            print("No console logs to fetch (capture requires ?debug or localStorage SLOPSTAG_DEBUG=true)")
 
     # Add keyboard shortcut to fetch logs (Ctrl+Shift+L)
     async def on_key(e):
@@ -177,7 +145,7 @@ def main():
         host="0.0.0.0",
         port=8080,
         title="Slopstag Image Editor",
-        reload=True,
+        reload=settings.DEV,
         show=False,
         uvicorn_reload_includes="*.py,*.js,*.css,*.html",
     )
@@ -0,0 +1,16 @@
+"""Conditional responses for deterministic POST endpoints."""
+
+from fastapi import Request, Response
+
+# Request header carrying the ETag of a result the client already holds.
+# The endpoints using it are POSTs, for which If-None-Match/304 is not a
+# valid conditional response (RFC 9110 specifies 412), so clients opt in
+# with this header and an unchanged result is answered with 204 No Content.
+CACHED_ETAG_HEADER = "X-Cached-ETag"
+
+
+def unchanged_response(request: Request, etag: str) -> Response | None:
+    """Return 204 No Content if the client already holds the result for ``etag``."""
+    if request.headers.get(CACHED_ETAG_HEADER) == etag:
+        return Response(status_code=204, headers={"ETag": etag})
+    return None
@@ -1,21 +1,76 @@
 """Filter API endpoints."""
 
+import asyncio
 import base64
+import hashlib
 import io
-import json
-import struct
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
+from typing import Any
 
 import numpy as np
+import orjson
 from fastapi import APIRouter, HTTPException, Request, Response
 from PIL import Image
 
+from ..config import settings
+from ..filters.base import BaseFilter
 from ..filters.registry import filter_registry
+from .caching import unchanged_response
 
 router = APIRouter()
 
-# Cache for filter previews - stores base64 PNG data
-_preview_cache: dict[str, str] = {}
+# Cache for filter previews - stores raw PNG bytes
+_preview_cache: dict[str, bytes] = {}
+
+# Serialized /previews/all response, rebuilt after new previews are rendered
+_all_previews_body: bytes | None = None
+
+# Cache for recent filter results - maps (filter_id, etag) to raw RGBA
+# buffers, bounded by their total size rather than the number of entries
+_RESULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_result_cache: OrderedDict[tuple[str, str], memoryview] = OrderedDict()
+_result_cache_bytes = 0
+
+
+def _cache_result(key: tuple[str, str], result_bytes: memoryview) -> None:
+    """Remember a filter result, evicting the oldest ones beyond the byte budget."""
+    global _result_cache_bytes
+
+    # A single result larger than the whole budget would evict everything.
+    # Concurrent identical requests all miss the cache, so the key may
+    # already be present; keep the first result and count it only once.
+    if result_bytes.nbytes > _RESULT_CACHE_MAX_BYTES or key in _result_cache:
+        return
+
+    _result_cache[key] = result_bytes
+    _result_cache_bytes += result_bytes.nbytes
+    while _result_cache_bytes > _RESULT_CACHE_MAX_BYTES:
+        _, evicted = _result_cache.popitem(last=False)
+        _result_cache_bytes -= evicted.nbytes
+
+
+def _store_previews(previews: dict[str, bytes]) -> None:
+    """Add rendered previews to the cache, invalidating the combined response."""
+    global _all_previews_body
+
+    _preview_cache.update(previews)
+    _all_previews_body = None
+
+
+def _get_filter_instance(filter_class: type[BaseFilter]) -> BaseFilter:
+    """Get a filter instance, reusing a shared one for stateless filters."""
+    if filter_class.stateless:
+        return _shared_filter_instance(filter_class)
+    return filter_class()
+
+
+@lru_cache(maxsize=None)
+def _shared_filter_instance(filter_class: type[BaseFilter]) -> BaseFilter:
+    """Create the shared instance of a stateless filter."""
+    return filter_class()
+
 
 # Sample image for filter previews (96x96 with various features to show filter effects)
 @lru_cache(maxsize=1)
@@ -29,33 +84,25 @@ def _get_sample_image() -> np.ndarray:
     """
     size = 96
     img = np.zeros((size, size, 4), dtype=np.uint8)
+    y, x = np.mgrid[:size, :size]
 
     # Create a gradient background (blue to orange)
-    for y in range(size):
-        for x in range(size):
-            t = x / size
-            r = int(50 + 180 * t)
-            g = int(100 + 80 * (1 - abs(t - 0.5) * 2))
-            b = int(200 * (1 - t))
-            img[y, x] = [r, g, b, 255]
+    t = x / size
+    img[..., 0] = (50 + 180 * t).astype(np.uint8)
+    img[..., 1] = (100 + 80 * (1 - np.abs(t - 0.5) * 2)).astype(np.uint8)
+    img[..., 2] = (200 * (1 - t)).astype(np.uint8)
+    img[..., 3] = 255
 
     # Add a white circle in the center
     cy, cx = size // 2, size // 2
     radius = size // 4
-    for y in range(size):
-        for x in range(size):
-            dist = np.sqrt((x - cx) ** 2 + (y - cy) ** 2)
-            if dist < radius:
-                img[y, x] = [255, 255, 255, 255]
-            elif dist < radius + 2:
-                # Soft edge
-                alpha = 1 - (dist - radius) / 2
-                img[y, x] = [
-                    int(255 * alpha + img[y, x, 0] * (1 - alpha)),
-                    int(255 * alpha + img[y, x, 1] * (1 - alpha)),
-                    int(255 * alpha + img[y, x, 2] * (1 - alpha)),
-                    255,
-                ]
+    dist = np.hypot(x - cx, y - cy)
+    img[dist < radius, :3] = 255
+
+    # Soft edge
+    edge = (dist >= radius) & (dist < radius + 2)
+    alpha = (1 - (dist[edge] - radius) / 2)[:, None]
+    img[edge, :3] = (255 * alpha + img[edge, :3] * (1 - alpha)).astype(np.uint8)
 
     # Add a dark rectangle in corner
     img[10:30, 10:40] = [40, 40, 50, 255]
@@ -65,6 +112,8 @@ def _get_sample_image() -> np.ndarray:
     img[70:90, 35:55] = [50, 255, 50, 255]  # Green
     img[70:90, 60:80] = [50, 50, 255, 255]  # Blue
 
+    # Shared between callers, so guard against in-place modification
+    img.flags.writeable = False
     return img
 
 
@@ -101,6 +150,73 @@ async def get_filter_info(filter_id: str):
     }
 
 
+async def _read_filter_request(
+    filter_id: str, request: Request
+) -> tuple[dict[str, Any], np.ndarray, str]:
+    """Stream a filter request body into a preallocated pixel array.
+
+    The metadata header is parsed as soon as it has arrived, then the
+    remaining chunks are copied straight into an RGBA array instead of
+    buffering the whole body first. The ETag hash is updated per chunk.
+
+    Returns (metadata, image, etag).
+    """
+    etag_hash = hashlib.blake2b(filter_id.encode("utf-8"), digest_size=8)
+    header = bytearray()
+    metadata = None
+    pixels = None
+    received = 0
+
+    async for chunk in request.stream():
+        etag_hash.update(chunk)
+
+        if metadata is None:
+            header += chunk
+            if len(header) < 4:
+                continue
+            metadata_length = int.from_bytes(header[:4], "little")
+            if len(header) < 4 + metadata_length:
+                continue
+
+            # Parse metadata
+            try:
+                metadata = orjson.loads(header[4 : 4 + metadata_length])
+            except orjson.JSONDecodeError as e:
+                raise HTTPException(status_code=400, detail=f"Invalid JSON metadata: {e}")
+
+            width = metadata.get("width")
+            height = metadata.get("height")
+            if not width or not height:
+                raise HTTPException(status_code=400, detail="Missing width or height in metadata")
+            if not all(type(size) is int and size > 0 for size in (width, height)):
+                raise HTTPException(status_code=400, detail="Width and height must be positive integers")
+            if width * height * 4 > settings.MAX_IMAGE_SIZE:
+                raise HTTPException(status_code=413, detail="Image too large")
+
+            image = np.empty((height, width, 4), dtype=np.uint8)
+            pixels = image.reshape(-1)
+            chunk = header[4 + metadata_length :]
+
+        # Copy RGBA data into the preallocated array
+        end = received + len(chunk)
+        if end <= pixels.size:
+            pixels[received:end] = np.frombuffer(chunk, dtype=np.uint8)
+        received = end
+
+    if metadata is None:
+        if len(header) < 4:
+            raise HTTPException(status_code=400, detail="Request body too short")
+        raise HTTPException(status_code=400, detail="Invalid metadata length")
+
+    if received != pixels.size:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid image data size. Expected {pixels.size}, got {received}",
+        )
+
+    return metadata, image, f'"{etag_hash.hexdigest()}"'
+
+
 @router.post("/{filter_id}")
 async def apply_filter(filter_id: str, request: Request):
     """Apply a filter to raw image data.
@@ -112,52 +228,39 @@ async def apply_filter(filter_id: str, request: Request):
 
     Response:
     - Raw RGBA pixel data (same dimensions as input)
+    - ETag header derived from the filter ID and request body. Requests
+      whose X-Cached-ETag header matches receive 204 No Content (the client
+      already holds the result), and repeated identical requests are served
+      from a small result cache. Filters that are not deterministic get
+      neither, and their responses carry no ETag.
     """
-    import numpy as np
-
     if filter_id not in filter_registry:
         raise HTTPException(status_code=404, detail=f"Filter not found: {filter_id}")
 
-    # Read raw body
-    body = await request.body()
-
-    if len(body) < 4:
-        raise HTTPException(status_code=400, detail="Request body too short")
-
-    # Parse metadata
-    metadata_length = struct.unpack("<I", body[:4])[0]
-    if len(body) < 4 + metadata_length:
-        raise HTTPException(status_code=400, detail="Invalid metadata length")
-
-    metadata_json = body[4 : 4 + metadata_length].decode("utf-8")
-    try:
-        metadata = json.loads(metadata_json)
-    except json.JSONDecodeError as e:
-        raise HTTPException(status_code=400, detail=f"Invalid JSON metadata: {e}")
-
-    width = metadata.get("width")
-    height = metadata.get("height")
+    # The pixel array is private to this request, so filters may write into it
+    metadata, image, etag = await _read_filter_request(filter_id, request)
     params = metadata.get("params", {})
+    filter_class = filter_registry[filter_id]
 
-    if not width or not height:
-        raise HTTPException(status_code=400, detail="Missing width or height in metadata")
-
-    # Extract RGBA data
-    rgba_data = body[4 + metadata_length :]
-    expected_size = width * height * 4
-    if len(rgba_data) != expected_size:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid image data size. Expected {expected_size}, got {len(rgba_data)}",
-        )
-
-    # Convert to numpy array
-    image = np.frombuffer(rgba_data, dtype=np.uint8).reshape((height, width, 4)).copy()
-
-    # Apply filter
-    filter_instance = filter_registry[filter_id]()
+    # Random filters give a new result for the same request every time
+    cache_key = (filter_id, etag) if filter_class.deterministic else None
+    if cache_key is not None:
+        unchanged = unchanged_response(request, etag)
+        if unchanged is not None:
+            return unchanged
+
+        if cache_key in _result_cache:
+            _result_cache.move_to_end(cache_key)
+            return Response(
+                content=_result_cache[cache_key],
+                media_type="application/octet-stream",
+                headers={"ETag": etag},
+            )
+
+    # Apply filter in a worker thread so the event loop stays responsive
+    filter_instance = _get_filter_instance(filter_class)
     try:
-        result = filter_instance.apply(image, **params)
+        result = await asyncio.to_thread(filter_instance.apply, image, **params)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Filter error: {e!s}")
 
@@ -165,29 +268,36 @@ async def apply_filter(filter_id: str, request: Request):
     if result.shape != image.shape:
         raise HTTPException(status_code=500, detail="Filter produced invalid output dimensions")
 
-    # Return raw RGBA bytes
-    return Response(content=result.tobytes(), media_type="application/octet-stream")
+    # The response body is a flat view of the result array, avoiding a
+    # tobytes() copy
+    result_bytes = memoryview(np.ascontiguousarray(result)).cast("B")
+    if cache_key is None:
+        return Response(content=result_bytes, media_type="application/octet-stream")
 
+    # Remember the result for identical repeat requests
+    _cache_result(cache_key, result_bytes)
 
-@router.get("/{filter_id}/preview")
-async def get_filter_preview(filter_id: str):
-    """Get a preview thumbnail of a filter applied to a sample image.
+    # Return raw RGBA bytes
+    return Response(
+        content=result_bytes,
+        media_type="application/octet-stream",
+        headers={"ETag": etag},
+    )
 
-    Returns a JSON object with a base64-encoded PNG thumbnail showing
-    the filter effect on a sample image. Results are cached for performance.
-    """
-    if filter_id not in filter_registry:
-        raise HTTPException(status_code=404, detail=f"Filter not found: {filter_id}")
 
-    # Check cache first
-    if filter_id in _preview_cache:
-        return {"preview": _preview_cache[filter_id]}
+def _render_preview(filter_id: str) -> bytes:
+    """Apply a filter with default parameters to the sample image.
 
+    Returns the result as PNG-encoded bytes.
+    """
     # Get sample image
-    sample = _get_sample_image().copy()
+    filter_class = filter_registry[filter_id]
+    sample = _get_sample_image()
+    if filter_class.mutates_input:
+        sample = sample.copy()
 
     # Apply filter with default parameters
-    filter_instance = filter_registry[filter_id]()
+    filter_instance = _get_filter_instance(filter_class)
     try:
         result = filter_instance.apply(sample)
     except Exception as e:
@@ -199,18 +309,52 @@ async def get_filter_preview(filter_id: str):
     if result is None or result.shape != sample.shape:
         result = sample
 
-    # Convert to PNG and base64 encode
+    # Convert to PNG
     pil_img = Image.fromarray(result)
     buffer = io.BytesIO()
-    pil_img.save(buffer, format="PNG")
-    buffer.seek(0)
-    base64_data = base64.b64encode(buffer.getvalue()).decode("utf-8")
-    data_url = f"data:image/png;base64,{base64_data}"
+    pil_img.save(buffer, format="PNG", compress_level=1, optimize=False)
+    return buffer.getvalue()
 
-    # Cache the result
-    _preview_cache[filter_id] = data_url
 
-    return {"preview": data_url}
+def warm_preview_cache() -> None:
+    """Precompute previews for all registered filters.
+
+    Called once at startup after filters and plugins are loaded, in a
+    background thread so it does not delay startup.
+    """
+    uncached = [filter_id for filter_id in filter_registry if filter_id not in _preview_cache]
+    if not uncached:
+        return
+
+    # Previews are independent and the heavy work runs in GIL-releasing C code
+    with ThreadPoolExecutor() as executor:
+        _store_previews(dict(zip(uncached, executor.map(_render_preview, uncached))))
+
+
+@router.get("/{filter_id}/preview")
+async def get_filter_preview(filter_id: str, request: Request):
+    """Get a preview thumbnail of a filter applied to a sample image.
+
+    Returns a PNG thumbnail showing the filter effect on a sample image.
+    Previews are precomputed at startup. The URL is not versioned, so
+    browsers must revalidate (no-cache); an unchanged preview is answered
+    with 304 Not Modified via its ETag.
+    """
+    if filter_id not in filter_registry:
+        raise HTTPException(status_code=404, detail=f"Filter not found: {filter_id}")
+
+    # Filters registered after startup are rendered on first request
+    if filter_id not in _preview_cache:
+        _store_previews({filter_id: await asyncio.to_thread(_render_preview, filter_id)})
+
+    png_bytes = _preview_cache[filter_id]
+    headers = {
+        "Cache-Control": "no-cache",
+        "ETag": f'"{hashlib.md5(png_bytes).hexdigest()}"',
+    }
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
+    return Response(content=png_bytes, media_type="image/png", headers=headers)
 
 
 @router.get("/previews/all")
@@ -218,40 +362,24 @@ async def get_all_filter_previews():
     """Get preview thumbnails for all filters.
 
     Returns a JSON object mapping filter IDs to base64-encoded PNG thumbnails.
-    This is useful for loading all previews at once.
+    This is useful for loading all previews at once. The payload is large,
+    so it is serialized with orjson once and reused until a new preview is
+    rendered.
     """
-    previews = {}
-
-    for filter_id in filter_registry:
-        # Check cache first
-        if filter_id in _preview_cache:
-            previews[filter_id] = _preview_cache[filter_id]
-            continue
-
-        # Get sample image
-        sample = _get_sample_image().copy()
-
-        # Apply filter with default parameters
-        filter_instance = filter_registry[filter_id]()
-        try:
-            result = filter_instance.apply(sample)
-        except Exception:
-            result = sample
-
-        # Ensure result is valid
-        if result is None or result.shape != sample.shape:
-            result = sample
-
-        # Convert to PNG and base64 encode
-        pil_img = Image.fromarray(result)
-        buffer = io.BytesIO()
-        pil_img.save(buffer, format="PNG")
-        buffer.seek(0)
-        base64_data = base64.b64encode(buffer.getvalue()).decode("utf-8")
-        data_url = f"data:image/png;base64,{base64_data}"
-
-        # Cache and add to result
-        _preview_cache[filter_id] = data_url
-        previews[filter_id] = data_url
-
-    return {"previews": previews}
+    global _all_previews_body
+
+    # Render previews of filters registered after startup off the event loop
+    uncached = [filter_id for filter_id in filter_registry if filter_id not in _preview_cache]
+    if uncached:
+        results = await asyncio.gather(
+            *(asyncio.to_thread(_render_preview, filter_id) for filter_id in uncached)
+        )
+        _store_previews(dict(zip(uncached, results)))
+
+    if _all_previews_body is None:
+        previews = {}
+        for filter_id in filter_registry:
+            base64_data = base64.b64encode(_preview_cache[filter_id]).decode("ascii")
+            previews[filter_id] = f"data:image/png;base64,{base64_data}"
+        _all_previews_body = orjson.dumps({"previews": previews})
+    return Response(_all_previews_body, media_type="application/json")
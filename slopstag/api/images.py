@@ -1,12 +1,12 @@
 """Image source API endpoints."""
 
-import json
-import struct
-
 import numpy as np
-from fastapi import APIRouter, HTTPException, Response
+import orjson
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 
 from ..images.providers import image_providers
+from .streaming import stream_buffers
 
 router = APIRouter()
 
@@ -56,22 +56,32 @@ async def get_image(source_id: str, image_id: str):
     except KeyError:
         raise HTTPException(status_code=404, detail=f"Image not found: {image_id}")
 
-    # Ensure RGBA format
-    if image.ndim == 2:  # Grayscale
-        image = np.stack([image, image, image, np.full_like(image, 255)], axis=-1)
-    elif image.shape[2] == 3:  # RGB
-        alpha = np.full((image.shape[0], image.shape[1], 1), 255, dtype=np.uint8)
-        image = np.concatenate([image, alpha], axis=-1)
+    height, width = image.shape[:2]
 
     # Build response metadata
     response_metadata = {
-        "width": image.shape[1],
-        "height": image.shape[0],
+        "width": width,
+        "height": height,
         **metadata,
     }
-    metadata_json = json.dumps(response_metadata).encode("utf-8")
+    metadata_json = orjson.dumps(response_metadata)
 
     # Pack response: [4 bytes length][metadata][rgba data]
-    response_data = struct.pack("<I", len(metadata_json)) + metadata_json + image.tobytes()
+    # Preallocate the full payload so the pixel data is copied only once
+    header = len(metadata_json).to_bytes(4, "little") + metadata_json
+    response_data = bytearray(len(header) + height * width * 4)
+    response_data[: len(header)] = header
+    rgba = np.frombuffer(response_data, dtype=np.uint8, offset=len(header)).reshape((height, width, 4))
+
+    # Ensure RGBA format, writing channels directly into the payload
+    if image.ndim == 2:  # Grayscale
+        rgba[..., :3] = image[..., np.newaxis]
+        rgba[..., 3] = 255
+    elif image.shape[2] == 3:  # RGB
+        rgba[..., :3] = image
+        rgba[..., 3] = 255
+    else:
+        rgba[...] = image
 
-    return Response(content=response_data, media_type="application/octet-stream")
+    # Stream the single payload buffer in chunks
+    return StreamingResponse(stream_buffers(response_data), media_type="application/octet-stream")
@@ -4,13 +4,27 @@ These endpoints enable rendering layers and documents in Python
 for cross-platform parity testing.
 """
 
+import asyncio
+import base64
+import hashlib
+import struct
 from typing import Any, Dict
 
-from fastapi import APIRouter, HTTPException, Response
+import numpy as np
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
-from ..rendering import render_layer, render_document, render_text_layer, render_vector_layer
+from ..rendering import (
+    apply_layer_effects,
+    render_document,
+    render_layer,
+    render_text_layer,
+    render_vector_layer,
+)
 from ..rendering.document import compute_pixel_diff, images_match
+from .caching import unchanged_response
+from .streaming import stream_buffers
 
 router = APIRouter(prefix="/rendering", tags=["rendering"])
 
@@ -36,41 +50,59 @@ class PixelDiffRequest(BaseModel):
     tolerance: float = 0.01
 
 
+async def _request_etag(http_request: Request) -> str:
+    """Derive an ETag from the raw request body.
+
+    Rendering is deterministic, so identical request bodies always produce
+    identical pixels.
+    """
+    body = await http_request.body()
+    return f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def _render_layer_pixels(layer_data: Dict[str, Any], width: int | None, height: int | None):
+    """Render a single layer of any type, with its effects, to an RGBA array."""
+    layer_type = layer_data.get("type", "raster")
+
+    if layer_type == "text":
+        pixels = render_text_layer(layer_data, output_width=width, output_height=height)
+    elif layer_type == "vector":
+        pixels = render_vector_layer(layer_data, width=width, height=height)
+    else:
+        pixels, _, _ = render_layer(layer_data)
+        return pixels
+
+    pixels, _, _ = apply_layer_effects(pixels, layer_data.get("effects", []))
+    return pixels
+
+
 @router.post("/layer")
-async def render_layer_endpoint(request: LayerRenderRequest) -> Response:
+async def render_layer_endpoint(request: LayerRenderRequest, http_request: Request) -> Response:
     """Render a single layer to RGBA bytes.
 
     Supports all layer types: raster, text, vector.
-    Returns raw RGBA bytes for comparison testing.
+    Returns raw RGBA bytes for comparison testing. Requests whose
+    X-Cached-ETag header matches receive 204 No Content.
     """
+    etag = await _request_etag(http_request)
+    unchanged = unchanged_response(http_request, etag)
+    if unchanged is not None:
+        return unchanged
+
     try:
-        layer_data = request.layer
-        layer_type = layer_data.get("type", "raster")
-
-        if layer_type == "text":
-            pixels = render_text_layer(
-                layer_data,
-                output_width=request.width,
-                output_height=request.height,
-            )
-        elif layer_type == "vector":
-            pixels = render_vector_layer(
-                layer_data,
-                width=request.width,
-                height=request.height,
-            )
-        else:
-            pixels, _, _ = render_layer(layer_data)
-
-        # Return raw RGBA bytes
-        rgba_bytes = pixels.tobytes()
-
-        return Response(
-            content=rgba_bytes,
+        # Rendering is CPU-bound, keep it off the event loop
+        pixels = await asyncio.to_thread(
+            _render_layer_pixels, request.layer, request.width, request.height
+        )
+
+        # Stream raw RGBA bytes
+        return StreamingResponse(
+            stream_buffers(pixels),
             media_type="application/octet-stream",
             headers={
                 "X-Image-Width": str(pixels.shape[1]),
                 "X-Image-Height": str(pixels.shape[0]),
+                "ETag": etag,
             },
         )
 
@@ -79,22 +111,27 @@ async def render_layer_endpoint(request: LayerRenderRequest) -> Response:
 
 
 @router.post("/document")
-async def render_document_endpoint(request: DocumentRenderRequest) -> Response:
+async def render_document_endpoint(request: DocumentRenderRequest, http_request: Request) -> Response:
     """Render a full document to RGBA bytes.
 
-    Returns composited document as raw RGBA bytes.
+    Returns composited document as raw RGBA bytes. Requests whose
+    X-Cached-ETag header matches receive 204 No Content.
     """
-    try:
-        pixels = render_document(request.document)
+    etag = await _request_etag(http_request)
+    unchanged = unchanged_response(http_request, etag)
+    if unchanged is not None:
+        return unchanged
 
-        rgba_bytes = pixels.tobytes()
+    try:
+        pixels = await asyncio.to_thread(render_document, request.document)
 
-        return Response(
-            content=rgba_bytes,
+        return StreamingResponse(
+            stream_buffers(pixels),
             media_type="application/octet-stream",
             headers={
                 "X-Image-Width": str(pixels.shape[1]),
                 "X-Image-Height": str(pixels.shape[0]),
+                "ETag": etag,
             },
         )
 
@@ -108,9 +145,6 @@ async def pixel_diff_endpoint(request: PixelDiffRequest) -> dict:
 
     Use this to verify JS and Python rendering match.
     """
-    import base64
-    import numpy as np
-
     try:
         # Decode images
         bytes1 = base64.b64decode(request.image1_base64)
@@ -123,8 +157,8 @@ async def pixel_diff_endpoint(request: PixelDiffRequest) -> dict:
             (request.height, request.width, 4)
         )
 
-        diff_ratio, _ = compute_pixel_diff(img1, img2)
-        match = images_match(img1, img2, tolerance=request.tolerance)
+        diff_ratio, _ = await asyncio.to_thread(compute_pixel_diff, img1, img2)
+        match = await asyncio.to_thread(images_match, img1, img2, tolerance=request.tolerance)
 
         return {
             "diff_ratio": diff_ratio,
@@ -134,3 +168,48 @@ async def pixel_diff_endpoint(request: PixelDiffRequest) -> dict:
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/diff-binary")
+async def pixel_diff_binary_endpoint(request: Request) -> dict:
+    """Compare two raw RGBA images and return diff metrics.
+
+    Binary counterpart of /diff that avoids the base64 encoding overhead.
+
+    Request format:
+    - First 12 bytes: width (uint32), height (uint32), tolerance (float32),
+      all little-endian
+    - Next width*height*4 bytes: first image as raw RGBA
+    - Next width*height*4 bytes: second image as raw RGBA
+    """
+    body = await request.body()
+    if len(body) < 12:
+        raise HTTPException(status_code=400, detail="Request body too short")
+
+    width, height, tolerance = struct.unpack("<IIf", body[:12])
+    image_size = width * height * 4
+    if len(body) != 12 + 2 * image_size:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid image data size. Expected {2 * image_size}, got {len(body) - 12}",
+        )
+
+    try:
+        # Zero-copy views into the request body
+        img1 = np.frombuffer(body, dtype=np.uint8, count=image_size, offset=12).reshape(
+            (height, width, 4)
+        )
+        img2 = np.frombuffer(body, dtype=np.uint8, count=image_size, offset=12 + image_size).reshape(
+            (height, width, 4)
+        )
+
+        diff_ratio, _ = await asyncio.to_thread(compute_pixel_diff, img1, img2)
+
+        return {
+            "diff_ratio": float(diff_ratio),
+            "match": bool(diff_ratio <= tolerance),
+            "tolerance": tolerance,
+        }
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
@@ -2,10 +2,13 @@
 
 from typing import Any
 
+import orjson
 from fastapi import APIRouter, HTTPException, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from ..sessions import session_manager
+from .streaming import LARGE_STREAM_CHUNK_SIZE, stream_buffers
 
 router = APIRouter(prefix="/sessions", tags=["sessions"])
 
@@ -73,14 +76,15 @@ async def get_session_image(session_id: str) -> Response:
 
     if rgba_bytes is None:
         raise HTTPException(
-            status_code=404 if "not found" in metadata.get("error", "").lower() else 500,
+            status_code=metadata.get("code", 500),
             detail=metadata.get("error", "Failed to get image"),
         )
 
-    return Response(
-        content=rgba_bytes,
+    return StreamingResponse(
+        stream_buffers(rgba_bytes, chunk_size=LARGE_STREAM_CHUNK_SIZE),
         media_type="application/octet-stream",
         headers={
+            "Content-Length": str(len(rgba_bytes)),
             "X-Image-Width": str(metadata.get("width", 0)),
             "X-Image-Height": str(metadata.get("height", 0)),
         },
@@ -94,14 +98,15 @@ async def get_layer_image(session_id: str, layer_id: str) -> Response:
 
     if rgba_bytes is None:
         raise HTTPException(
-            status_code=404 if "not found" in metadata.get("error", "").lower() else 500,
+            status_code=metadata.get("code", 500),
             detail=metadata.get("error", "Failed to get layer image"),
         )
 
-    return Response(
-        content=rgba_bytes,
+    return StreamingResponse(
+        stream_buffers(rgba_bytes, chunk_size=LARGE_STREAM_CHUNK_SIZE),
         media_type="application/octet-stream",
         headers={
+            "Content-Length": str(len(rgba_bytes)),
             "X-Image-Width": str(metadata.get("width", 0)),
             "X-Image-Height": str(metadata.get("height", 0)),
             "X-Layer-Name": metadata.get("layer_name", ""),
@@ -135,7 +140,7 @@ async def execute_tool(
 
     if not result.get("success"):
         raise HTTPException(
-            status_code=404 if "not found" in result.get("error", "").lower() else 500,
+            status_code=result.get("code", 500),
             detail=result.get("error", "Tool execution failed"),
         )
 
@@ -165,7 +170,7 @@ async def execute_command(
 
     if not result.get("success"):
         raise HTTPException(
-            status_code=404 if "not found" in result.get("error", "").lower() else 500,
+            status_code=result.get("code", 500),
             detail=result.get("error", "Command execution failed"),
         )
 
@@ -173,22 +178,25 @@ async def execute_command(
 
 
 @router.get("/{session_id}/document/export")
-async def export_document(session_id: str) -> dict:
+async def export_document(session_id: str) -> Response:
     """Export the full document as JSON for cross-platform transfer.
 
     Returns the complete document structure including all layers,
     their content (raster as PNG data URLs, text/vector as data),
     and document metadata.
+
+    The document is plain JSON data from the editor, so it is serialized
+    directly with orjson instead of walking it with jsonable_encoder first.
     """
     document, metadata = await session_manager.export_document(session_id)
 
     if document is None:
         raise HTTPException(
-            status_code=404 if "not found" in metadata.get("error", "").lower() else 500,
+            status_code=metadata.get("code", 500),
             detail=metadata.get("error", "Failed to export document"),
         )
 
-    return {"document": document}
+    return Response(orjson.dumps({"document": document}), media_type="application/json")
 
 
 @router.post("/{session_id}/document/import")
@@ -208,7 +216,7 @@ async def import_document(
 
     if not result.get("success"):
         raise HTTPException(
-            status_code=404 if "not found" in result.get("error", "").lower() else 500,
+            status_code=result.get("code", 500),
             detail=result.get("error", "Failed to import document"),
         )
 
@@ -237,7 +245,7 @@ async def get_config(session_id: str, path: str | None = None) -> dict:
 
     if config is None:
         raise HTTPException(
-            status_code=404 if "not found" in metadata.get("error", "").lower() else 500,
+            status_code=metadata.get("code", 500),
             detail=metadata.get("error", "Failed to get config"),
         )
 
@@ -265,7 +273,7 @@ async def set_config(session_id: str, request: ConfigSetRequest) -> dict:
 
     if not result.get("success"):
         raise HTTPException(
-            status_code=404 if "not found" in result.get("error", "").lower() else 500,
+            status_code=result.get("code", 500),
             detail=result.get("error", "Failed to set config"),
         )
 
@@ -286,7 +294,7 @@ async def list_layer_effects(session_id: str, layer_id: str) -> dict:
 
     if effects is None:
         raise HTTPException(
-            status_code=404 if "not found" in metadata.get("error", "").lower() else 500,
+            status_code=metadata.get("code", 500),
             detail=metadata.get("error", "Failed to get effects"),
         )
 
@@ -321,7 +329,7 @@ async def add_layer_effect(
 
     if not result.get("success"):
         raise HTTPException(
-            status_code=404 if "not found" in result.get("error", "").lower() else 500,
+            status_code=result.get("code", 500),
             detail=result.get("error", "Failed to add effect"),
         )
 
@@ -351,7 +359,7 @@ async def update_layer_effect(
 
     if not result.get("success"):
         raise HTTPException(
-            status_code=404 if "not found" in result.get("error", "").lower() else 500,
+            status_code=result.get("code", 500),
             detail=result.get("error", "Failed to update effect"),
         )
 
@@ -373,7 +381,7 @@ async def remove_layer_effect(
 
     if not result.get("success"):
         raise HTTPException(
-            status_code=404 if "not found" in result.get("error", "").lower() else 500,
+            status_code=result.get("code", 500),
             detail=result.get("error", "Failed to remove effect"),
         )
 
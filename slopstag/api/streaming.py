@@ -0,0 +1,28 @@
+"""Chunked streaming of raw image payloads."""
+
+from collections.abc import AsyncIterator
+
+import numpy as np
+
+# Size of each chunk handed to the ASGI server
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Larger chunks for full session images, which can reach tens of MiB
+LARGE_STREAM_CHUNK_SIZE = 256 * 1024
+
+
+async def stream_buffers(
+    *buffers: bytes | bytearray | np.ndarray,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> AsyncIterator[memoryview]:
+    """Yield buffers as fixed-size memoryview slices without copying.
+
+    Used with StreamingResponse so the server can start writing large RGBA
+    payloads to the socket before the whole body has been sent.
+    """
+    for buffer in buffers:
+        if isinstance(buffer, np.ndarray):
+            buffer = np.ascontiguousarray(buffer)
+        view = memoryview(buffer).cast("B")
+        for start in range(0, len(view), chunk_size):
+            yield view[start : start + chunk_size]
@@ -1,8 +1,11 @@
 """FastAPI application factory."""
 
+import threading
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from .api.filters import warm_preview_cache
 from .api.router import api_router
 from .config import settings
 from .filters.registry import load_builtin_filters
@@ -18,6 +21,11 @@ def create_api_app() -> FastAPI:
     load_providers()
     load_plugins(settings.PLUGINS_DIR)
 
+    # Loaders stay sequential so filter registration order is deterministic.
+    # Previews are warmed in the background; the preview endpoints render any
+    # preview that is not ready yet on demand.
+    threading.Thread(target=warm_preview_cache, name="preview-warmup", daemon=True).start()
+
     app = FastAPI(
         title="Slopstag Image Editor API",
         description="Backend API for Python image processing filters",
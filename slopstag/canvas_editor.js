@@ -1245,7 +1245,7 @@ export default {
             tabletColorPickerTarget: 'fg',   // 'fg' or 'bg'
 
             // Filter preview system
-            filterPreviews: {},              // Cache: { filterId: base64ImageData }
+            filterPreviews: {},              // Cache: { filterId: objectURL }
             filterPreviewsLoading: {},       // { filterId: boolean }
             filterSampleImageLoaded: false,  // Has the sample image been loaded
             tabletBrushSize: 20,             // Current brush/eraser size for tablet UI
@@ -2491,8 +2491,8 @@ export default {
             try {
                 const response = await fetch(`/api/filters/${filterId}/preview`);
                 if (response.ok) {
-                    const data = await response.json();
-                    this.filterPreviews[filterId] = data.preview;
+                    const blob = await response.blob();
+                    this.filterPreviews[filterId] = URL.createObjectURL(blob);
                 }
             } catch (err) {
                 console.warn(`Failed to load filter preview for ${filterId}:`, err);
@@ -5453,7 +5453,7 @@ export default {
 
                     // Composite all visible layers
                     for (const layer of app.layerStack.layers) {
-                        if (!layer.visible) continue;
+                        if (!layer.visible || layer.opacity <= 0) continue;
                         ctx.globalAlpha = layer.opacity;
                         ctx.drawImage(layer.canvas, 0, 0);
                     }
@@ -5479,12 +5479,18 @@ export default {
         },
 
         arrayBufferToBase64(buffer) {
-            let binary = '';
             const bytes = new Uint8Array(buffer);
-            for (let i = 0; i < bytes.byteLength; i++) {
-                binary += String.fromCharCode(bytes[i]);
+            // Native encoder where available (no intermediate binary string)
+            if (typeof bytes.toBase64 === 'function') return bytes.toBase64();
+
+            // Build the binary string in chunks; per-byte concatenation is
+            // very slow for full-canvas RGBA buffers
+            const chunkSize = 0x8000;
+            const chunks = [];
+            for (let i = 0; i < bytes.length; i += chunkSize) {
+                chunks.push(String.fromCharCode.apply(null, bytes.subarray(i, i + chunkSize)));
             }
-            return btoa(binary);
+            return btoa(chunks.join(''));
         },
 
         async exportDocument() {
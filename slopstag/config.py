@@ -4,19 +4,25 @@ from pathlib import Path
 
 from pydantic_settings import BaseSettings
 
+# Project root, resolved once at import
+_BASE_DIR = Path(__file__).resolve().parent.parent
+
 
 class Settings(BaseSettings):
     """Application settings."""
 
     # Paths
-    BASE_DIR: Path = Path(__file__).parent.parent
-    PLUGINS_DIR: Path = BASE_DIR / "plugins"
+    BASE_DIR: Path = _BASE_DIR
+    PLUGINS_DIR: Path = _BASE_DIR / "plugins"
 
     # API settings
     MAX_IMAGE_SIZE: int = 4096 * 4096 * 4  # Max raw image bytes (4K x 4K RGBA)
     FILTER_TIMEOUT: float = 30.0  # Seconds
 
-    model_config = {"env_prefix": "SLOPSTAG_"}
+    # Development mode (hot reload, no browser caching)
+    DEV: bool = False
+
+    model_config = {"env_prefix": "SLOPSTAG_", "frozen": True}
 
 
 settings = Settings()
@@ -5,7 +5,7 @@ Provides Photoshop-style layer effects for server-side rendering.
 Each effect is in its own file for clean architecture.
 """
 
-from .base import LayerEffect
+from .base import LayerEffect, compute_effect_roi
 from .drop_shadow import DropShadowEffect
 from .inner_shadow import InnerShadowEffect
 from .outer_glow import OuterGlowEffect
@@ -36,13 +36,17 @@ effect_render_order = [
     'stroke'           # On top of layer
 ]
 
+# Position of each effect type in the render order, for use as a sort key
+effect_render_index = {name: index for index, name in enumerate(effect_render_order)}
+
+# Bound from_dict factories, resolved once instead of per deserialization
+_effect_factories = {name: cls.from_dict for name, cls in effect_registry.items()}
+
 
 def deserialize_effect(data: dict) -> LayerEffect | None:
     """Create effect from serialized data."""
-    effect_type = data.get('type')
-    if effect_type not in effect_registry:
-        return None
-    return effect_registry[effect_type].from_dict(data)
+    factory = _effect_factories.get(data.get('type'))
+    return factory(data) if factory else None
 
 
 def get_available_effects() -> list[dict]:
@@ -55,6 +59,7 @@ def get_available_effects() -> list[dict]:
 
 __all__ = [
     'LayerEffect',
+    'compute_effect_roi',
     'DropShadowEffect',
     'InnerShadowEffect',
     'OuterGlowEffect',
@@ -64,6 +69,7 @@ __all__ = [
     'ColorOverlayEffect',
     'effect_registry',
     'effect_render_order',
+    'effect_render_index',
     'deserialize_effect',
     'get_available_effects',
 ]
@@ -2,21 +2,30 @@
 Base class for layer effects.
 """
 import uuid
-from dataclasses import dataclass, field
-from typing import Any
+from dataclasses import dataclass, fields
+from functools import cache
+from typing import Any, ClassVar
 
+import cv2
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class LayerEffect:
     """Base class for all layer effects."""
 
-    type: str = field(init=False)
-    display_name: str = field(init=False, default='Effect')
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    type: ClassVar[str]
+    display_name: ClassVar[str] = 'Effect'
+    id: str | None = None
     enabled: bool = True
     blend_mode: str = 'normal'
     opacity: float = 1.0
 
+    def __post_init__(self) -> None:
+        # Only generate an ID when none is given (e.g. not on deserialization)
+        if not self.id:
+            self.id = str(uuid.uuid4())
+
     def get_expansion(self) -> dict[str, int]:
         """Get expansion needed beyond layer bounds."""
         return {'left': 0, 'top': 0, 'right': 0, 'bottom': 0}
@@ -38,10 +47,42 @@ class LayerEffect:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> 'LayerEffect':
-        """Create effect from dictionary."""
-        return cls(
-            id=data.get('id', str(uuid.uuid4())),
-            enabled=data.get('enabled', True),
-            blend_mode=data.get('blendMode', 'normal'),
-            opacity=data.get('opacity', 1.0),
-        )
+        """Create effect from dictionary.
+
+        Keys are the camelCase forms of the field names (e.g. ``offsetX`` for
+        ``offset_x``); missing keys fall back to the field defaults.
+        """
+        return cls(**{name: data[key] for name, key in _field_keys(cls) if key in data})
+
+
+def _camel_case(name: str) -> str:
+    """Convert a snake_case field name to its camelCase dictionary key."""
+    head, *rest = name.split('_')
+    return head + ''.join(part.title() for part in rest)
+
+
+@cache
+def _field_keys(cls: type[LayerEffect]) -> tuple[tuple[str, str], ...]:
+    """Get (field name, dictionary key) pairs for an effect class, once per class."""
+    return tuple((f.name, _camel_case(f.name)) for f in fields(cls) if f.init)
+
+
+def compute_effect_roi(
+    effect: LayerEffect, alpha_mask: np.ndarray, margin: int = 0
+) -> tuple[int, int, int, int] | None:
+    """Get the region an effect can touch, as (x, y, width, height).
+
+    This is the bounding box of the non-transparent pixels, padded by the
+    effect's expansion plus ``margin`` (e.g. blur or offset reach) and
+    clipped to the mask. Returns None for a fully transparent mask.
+    """
+    x, y, w, h = cv2.boundingRect(np.ascontiguousarray(alpha_mask))
+    if w == 0 or h == 0:
+        return None
+
+    pad = effect.get_expansion()
+    left = max(x - pad['left'] - margin, 0)
+    top = max(y - pad['top'] - margin, 0)
+    right = min(x + w + pad['right'] + margin, alpha_mask.shape[1])
+    bottom = min(y + h + pad['bottom'] + margin, alpha_mask.shape[0])
+    return left, top, right - left, bottom - top
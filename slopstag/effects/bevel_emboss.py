@@ -1,15 +1,38 @@
 """Bevel & Emboss effect."""
-from dataclasses import dataclass, field
-from typing import Any
-from .base import LayerEffect
+import math
+from dataclasses import dataclass
+from typing import Any, ClassVar
 
+import cv2
+import numpy as np
 
-@dataclass
+from .base import LayerEffect, compute_effect_roi
+
+
+def _hex_to_rgb(hex_color: str) -> np.ndarray:
+    """Convert a #RRGGBB color to a float RGB array (black if invalid)."""
+    value = hex_color.lstrip('#')
+    try:
+        return np.array([int(value[i:i + 2], 16) for i in (0, 2, 4)], dtype=np.float32)
+    except (ValueError, IndexError):
+        return np.zeros(3, dtype=np.float32)
+
+
+def _shift(mask: np.ndarray, dx: float, dy: float) -> np.ndarray:
+    """Translate a mask by a subpixel offset, filling with zeros."""
+    matrix = np.float32([[1, 0, dx], [0, 1, dy]])
+    return cv2.warpAffine(
+        mask, matrix, (mask.shape[1], mask.shape[0]),
+        flags=cv2.INTER_LINEAR, borderMode=cv2.BORDER_CONSTANT, borderValue=0,
+    )
+
+
+@dataclass(slots=True)
 class BevelEmbossEffect(LayerEffect):
     """Creates beveled/embossed 3D-like edges on the layer."""
 
-    type: str = field(init=False, default='bevelEmboss')
-    display_name: str = field(init=False, default='Bevel & Emboss')
+    type: ClassVar[str] = 'bevelEmboss'
+    display_name: ClassVar[str] = 'Bevel & Emboss'
 
     style: str = 'innerBevel'  # innerBevel, outerBevel, emboss, pillowEmboss
     depth: int = 3
@@ -25,10 +48,89 @@ class BevelEmbossEffect(LayerEffect):
 
     def get_expansion(self) -> dict[str, int]:
         if self.style == 'outerBevel':
-            expand = int(self.size)
+            expand = math.ceil(self.size)
             return {'left': expand, 'top': expand, 'right': expand, 'bottom': expand}
         return {'left': 0, 'top': 0, 'right': 0, 'bottom': 0}
 
+    def render(self, layer_rgba: np.ndarray) -> np.ndarray:
+        """Apply the effect to an RGBA layer already padded by get_expansion().
+
+        Mirrors EffectRenderer.renderBevelEmboss in the frontend: the edge
+        ring (shape minus shape eroded by ``size``) is split into highlight
+        and shadow halves by offsetting the shape along the light direction.
+        Erosion, shifts and the soften blur run in OpenCV.
+
+        Only the bounding box of the layer's visible pixels, padded by the
+        reach of the erosion, shifts and soften blur, is processed.
+
+        Returns a new RGBA uint8 array of the same shape.
+        """
+        size = self.size or self.depth or 3
+        margin = 2 * math.ceil(size) + 1
+        if self.soften > 0:
+            margin += math.ceil(4 * self.soften) + 1
+
+        # Outside the region the masks are empty: inner styles leave the
+        # layer as is, destination-over clears the color of its transparent
+        # pixels
+        inner = self.style in ('innerBevel', 'pillowEmboss')
+        result = layer_rgba.copy() if inner else np.zeros_like(layer_rgba)
+        roi = compute_effect_roi(self, layer_rgba[..., 3], margin)
+        if roi is None:
+            return result
+
+        x, y, w, h = roi
+        result[y:y + h, x:x + w] = self._render_region(layer_rgba[y:y + h, x:x + w], size, inner)
+        return result
+
+    def _render_region(self, layer_rgba: np.ndarray, size: float, inner: bool) -> np.ndarray:
+        alpha = layer_rgba[..., 3].astype(np.float32) / 255
+        dir_mult = -1 if self.direction == 'down' else 1
+        angle = math.radians(self.angle)
+        light_x = math.cos(angle) * dir_mult * size
+        light_y = -math.sin(angle) * dir_mult * size
+
+        # Edge ring = original - eroded
+        radius = max(1, math.ceil(size))
+        kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (2 * radius + 1, 2 * radius + 1))
+        eroded = cv2.erode(alpha, kernel, borderType=cv2.BORDER_CONSTANT, borderValue=0)
+        edge = alpha * (1 - eroded)
+
+        highlight = _shift(alpha, light_x, light_y) * edge
+        shadow = _shift(alpha, -light_x, -light_y) * edge
+
+        # Soften draws a blurred copy over each mask (CSS blur radius is sigma)
+        if self.soften > 0:
+            for mask in (highlight, shadow):
+                blurred = cv2.GaussianBlur(mask, (0, 0), sigmaX=self.soften)
+                mask[...] = blurred + mask * (1 - blurred)
+
+        out_rgb = layer_rgba[..., :3].astype(np.float32)
+        out_alpha = alpha
+        for mask, color, opacity in (
+            (highlight, self.highlight_color, self.highlight_opacity),
+            (shadow, self.shadow_color, self.shadow_opacity),
+        ):
+            # The effect opacity acts like the canvas globalAlpha in JS
+            src_alpha = (mask * opacity * self.opacity)[..., np.newaxis]
+            src_rgb = _hex_to_rgb(color)
+            if inner:
+                # source-atop: paint on the layer, keep its alpha
+                out_rgb = src_rgb * src_alpha + out_rgb * (1 - src_alpha)
+            else:
+                # destination-over: paint behind the layer
+                dst_alpha = out_alpha[..., np.newaxis]
+                new_alpha = dst_alpha + src_alpha * (1 - dst_alpha)
+                out_rgb = (out_rgb * dst_alpha + src_rgb * src_alpha * (1 - dst_alpha)) / np.maximum(
+                    new_alpha, 1e-6
+                )
+                out_alpha = new_alpha[..., 0]
+
+        result = np.empty_like(layer_rgba)
+        result[..., :3] = np.clip(out_rgb + 0.5, 0, 255)
+        result[..., 3] = np.clip(out_alpha * 255 + 0.5, 0, 255)
+        return result
+
     def get_params(self) -> dict[str, Any]:
         return {
             'style': self.style,
@@ -43,23 +145,3 @@ class BevelEmbossEffect(LayerEffect):
             'shadowColor': self.shadow_color,
             'shadowOpacity': self.shadow_opacity
         }
-
-    @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> 'BevelEmbossEffect':
-        return cls(
-            id=data.get('id'),
-            enabled=data.get('enabled', True),
-            blend_mode=data.get('blendMode', 'normal'),
-            opacity=data.get('opacity', 1.0),
-            style=data.get('style', 'innerBevel'),
-            depth=data.get('depth', 3),
-            direction=data.get('direction', 'up'),
-            size=data.get('size', 5),
-            soften=data.get('soften', 0),
-            angle=data.get('angle', 120),
-            altitude=data.get('altitude', 30),
-            highlight_color=data.get('highlightColor', '#FFFFFF'),
-            highlight_opacity=data.get('highlightOpacity', 0.75),
-            shadow_color=data.get('shadowColor', '#000000'),
-            shadow_opacity=data.get('shadowOpacity', 0.75),
-        )
@@ -1,15 +1,15 @@
 """Color Overlay effect."""
-from dataclasses import dataclass, field
-from typing import Any
+from dataclasses import dataclass
+from typing import Any, ClassVar
 from .base import LayerEffect
 
 
-@dataclass
+@dataclass(slots=True)
 class ColorOverlayEffect(LayerEffect):
     """Overlays a solid color on the layer content."""
 
-    type: str = field(init=False, default='colorOverlay')
-    display_name: str = field(init=False, default='Color Overlay')
+    type: ClassVar[str] = 'colorOverlay'
+    display_name: ClassVar[str] = 'Color Overlay'
 
     color: str = '#FF0000'
 
@@ -18,13 +18,3 @@ class ColorOverlayEffect(LayerEffect):
 
     def get_params(self) -> dict[str, Any]:
         return {'color': self.color}
-
-    @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> 'ColorOverlayEffect':
-        return cls(
-            id=data.get('id'),
-            enabled=data.get('enabled', True),
-            blend_mode=data.get('blendMode', 'normal'),
-            opacity=data.get('opacity', 1.0),
-            color=data.get('color', '#FF0000'),
-        )
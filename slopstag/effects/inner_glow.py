@@ -1,15 +1,15 @@
 """Inner Glow effect."""
-from dataclasses import dataclass, field
-from typing import Any
+from dataclasses import dataclass
+from typing import Any, ClassVar
 from .base import LayerEffect
 
 
-@dataclass
+@dataclass(slots=True)
 class InnerGlowEffect(LayerEffect):
     """Creates a colored glow inside the layer content edges."""
 
-    type: str = field(init=False, default='innerGlow')
-    display_name: str = field(init=False, default='Inner Glow')
+    type: ClassVar[str] = 'innerGlow'
+    display_name: ClassVar[str] = 'Inner Glow'
 
     blur: int = 10
     choke: int = 0
@@ -28,17 +28,3 @@ class InnerGlowEffect(LayerEffect):
             'colorOpacity': self.color_opacity,
             'source': self.source
         }
-
-    @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> 'InnerGlowEffect':
-        return cls(
-            id=data.get('id'),
-            enabled=data.get('enabled', True),
-            blend_mode=data.get('blendMode', 'normal'),
-            opacity=data.get('opacity', 1.0),
-            blur=data.get('blur', 10),
-            choke=data.get('choke', 0),
-            color=data.get('color', '#FFFF00'),
-            color_opacity=data.get('colorOpacity', 0.75),
-            source=data.get('source', 'edge'),
-        )
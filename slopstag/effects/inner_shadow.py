@@ -1,15 +1,15 @@
 """Inner Shadow effect."""
-from dataclasses import dataclass, field
-from typing import Any
+from dataclasses import dataclass
+from typing import Any, ClassVar
 from .base import LayerEffect
 
 
-@dataclass
+@dataclass(slots=True)
 class InnerShadowEffect(LayerEffect):
     """Creates a shadow inside the layer content edges."""
 
-    type: str = field(init=False, default='innerShadow')
-    display_name: str = field(init=False, default='Inner Shadow')
+    type: ClassVar[str] = 'innerShadow'
+    display_name: ClassVar[str] = 'Inner Shadow'
 
     offset_x: int = 2
     offset_y: int = 2
@@ -30,18 +30,3 @@ class InnerShadowEffect(LayerEffect):
             'color': self.color,
             'colorOpacity': self.color_opacity
         }
-
-    @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> 'InnerShadowEffect':
-        return cls(
-            id=data.get('id'),
-            enabled=data.get('enabled', True),
-            blend_mode=data.get('blendMode', 'normal'),
-            opacity=data.get('opacity', 1.0),
-            offset_x=data.get('offsetX', 2),
-            offset_y=data.get('offsetY', 2),
-            blur=data.get('blur', 5),
-            choke=data.get('choke', 0),
-            color=data.get('color', '#000000'),
-            color_opacity=data.get('colorOpacity', 0.75),
-        )
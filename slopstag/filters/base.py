@@ -13,6 +13,19 @@ class BaseFilter(ABC):
     description: str = "Base filter description"
     category: str = "uncategorized"
 
+    # Filters that write into the input array must set this so callers pass
+    # a writable copy; otherwise the input may be a read-only view.
+    mutates_input: bool = False
+
+    # Stateless filters are instantiated once and reused across requests.
+    # Filters that keep per-call state in attributes must set this to False.
+    stateless: bool = True
+
+    # Deterministic filters always produce the same output for the same
+    # input and parameters, so their results may be cached and revalidated.
+    # Filters with random output (e.g. noise) must set this to False.
+    deterministic: bool = True
+
     @classmethod
     def get_params_schema(cls) -> list[dict[str, Any]]:
         """Return parameter schema for this filter.
@@ -32,12 +45,29 @@ class BaseFilter(ABC):
         """
         return []
 
+    def _rgba_output_like(self, image: np.ndarray) -> np.ndarray:
+        """Allocate an RGBA result carrying over the input's alpha channel.
+
+        Filters that only touch color write their RGB output into
+        ``result[:, :, :3]`` instead of concatenating a new alpha plane.
+        """
+        result = np.empty_like(image)
+        result[:, :, 3] = image[:, :, 3]
+        return result
+
+    def _to_gray_u8(self, image: np.ndarray) -> np.ndarray:
+        """Convert an RGBA image to 8-bit BT.601 luminance, ignoring alpha."""
+        import cv2
+
+        return cv2.cvtColor(image, cv2.COLOR_RGBA2GRAY)
+
     @abstractmethod
     def apply(self, image: np.ndarray, **params) -> np.ndarray:
         """Apply the filter to an image.
 
         Args:
-            image: RGBA numpy array, shape (height, width, 4), dtype uint8
+            image: RGBA numpy array, shape (height, width, 4), dtype uint8.
+                Read-only unless the filter sets ``mutates_input``.
             **params: Filter parameters
 
         Returns:
@@ -1,13 +1,20 @@
 """Blur filters."""
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 import numpy as np
 from scipy import ndimage
-from skimage.filters import gaussian
 
 from .base import BaseFilter
 from .registry import register_filter
 
 
+# Runs the alpha blur of apply_blur_alpha_aware next to the RGB blur; SciPy
+# and OpenCV release the GIL inside their loops
+_BLUR_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="blur")
+
+
 def apply_blur_alpha_aware(image: np.ndarray, blur_func, **kwargs) -> np.ndarray:
     """
     Apply blur filter with proper alpha handling.
@@ -21,29 +28,99 @@ def apply_blur_alpha_aware(image: np.ndarray, blur_func, **kwargs) -> np.ndarray
     Returns:
         Blurred RGBA image as uint8 array
     """
-    # Separate channels and convert to float
-    rgb = image[:, :, :3].astype(np.float32) / 255.0
-    alpha = image[:, :, 3:4].astype(np.float32) / 255.0
+    # Separate channels and convert to float (in place to limit temporaries)
+    rgb = image[:, :, :3].astype(np.float32)
+    rgb /= 255.0
+    alpha = image[:, :, 3:4].astype(np.float32)
+    alpha /= 255.0
 
     # Pre-multiply RGB by alpha
-    rgb_premult = rgb * alpha
+    rgb *= alpha
 
-    # Apply blur to pre-multiplied RGB and alpha separately
-    rgb_blurred = blur_func(rgb_premult, **kwargs)
-    alpha_blurred = blur_func(alpha, **kwargs)
+    # Apply blur to pre-multiplied RGB and alpha separately, concurrently
+    alpha_future = _BLUR_POOL.submit(blur_func, alpha, **kwargs)
+    rgb_blurred = blur_func(rgb, **kwargs)
+    alpha_blurred = alpha_future.result()
 
-    # Un-premultiply (avoid division by zero)
+    # Un-premultiply in place (avoid division by zero)
     alpha_safe = np.maximum(alpha_blurred, 1e-6)
-    rgb_result = rgb_blurred / alpha_safe
-    rgb_result = np.clip(rgb_result, 0, 1)
+    np.divide(rgb_blurred, alpha_safe, out=rgb_blurred)
+    np.clip(rgb_blurred, 0, 1, out=rgb_blurred)
+    np.clip(alpha_blurred, 0, 1, out=alpha_safe)
+
+    # Scale straight into a single uint8 array (the cast truncates)
+    result = np.empty(image.shape, dtype=np.uint8)
+    np.multiply(rgb_blurred, 255, out=result[:, :, :3], casting="unsafe")
+    np.multiply(alpha_safe, 255, out=result[:, :, 3:4], casting="unsafe")
+    return result
 
-    # Convert back to uint8
-    rgb_uint8 = (rgb_result * 255).astype(np.uint8)
-    alpha_uint8 = (np.clip(alpha_blurred, 0, 1) * 255).astype(np.uint8)
 
-    # Recombine
-    result = np.concatenate([rgb_uint8, alpha_uint8], axis=2)
-    return result
+# Above this sigma the recursive Gaussian beats cv2's FIR kernel, whose cost
+# grows linearly with the kernel size
+_IIR_SIGMA_THRESHOLD = 15.0
+
+
+def _iir_pass(arr: np.ndarray, coeffs, gain, pad: int) -> np.ndarray:
+    """Run a causal then anticausal 3rd-order recursion along axis 0.
+
+    Each step processes a whole row at once, so the Python loop is O(length)
+    while the per-step work is vectorized. The start is seeded with the edge
+    value (the exact steady state for replicated borders); the end is padded
+    with ``pad`` replicated samples so the backward pass starts settled.
+    """
+    c1, c2, c3 = coeffs
+    n = arr.shape[0]
+    out = np.empty((n + pad,) + arr.shape[1:], dtype=np.float32)
+    out[:n] = arr
+    out[n:] = arr[n - 1]
+
+    y1 = y2 = y3 = out[0].copy()
+    for i in range(n + pad):
+        y = gain * out[i] + c1 * y1 + c2 * y2 + c3 * y3
+        out[i] = y
+        y3, y2, y1 = y2, y1, y
+    for i in range(n + pad - 1, -1, -1):
+        y = gain * out[i] + c1 * y1 + c2 * y2 + c3 * y3
+        out[i] = y
+        y3, y2, y1 = y2, y1, y
+    return out[:n]
+
+
+def _gaussian_iir(img_f32: np.ndarray, sigma: float) -> np.ndarray:
+    """Approximate a Gaussian blur with the Young-van Vliet recursive filter.
+
+    Cost per pixel is independent of sigma. Borders are replicated, matching
+    the FIR path.
+    """
+    if sigma >= 2.5:
+        q = 0.98711 * sigma - 0.96330
+    else:
+        q = 3.97156 - 4.14554 * np.sqrt(1 - 0.26891 * sigma)
+    b0 = 1.57825 + 2.44413 * q + 1.4281 * q**2 + 0.422205 * q**3
+    b1 = 2.44413 * q + 2.85619 * q**2 + 1.26661 * q**3
+    b2 = -(1.4281 * q**2 + 1.26661 * q**3)
+    b3 = 0.422205 * q**3
+    coeffs = (np.float32(b1 / b0), np.float32(b2 / b0), np.float32(b3 / b0))
+    gain = np.float32(1 - (b1 + b2 + b3) / b0)
+    pad = int(4 * sigma) + 1
+
+    blurred = _iir_pass(img_f32, coeffs, gain, pad)
+    blurred = _iir_pass(np.ascontiguousarray(blurred.swapaxes(0, 1)), coeffs, gain, pad)
+    return np.ascontiguousarray(blurred.swapaxes(0, 1))
+
+
+@lru_cache(maxsize=64)
+def _gaussian_kernel(ksize: int, sigma: float) -> np.ndarray:
+    """Get the 1D float32 Gaussian kernel for a size and sigma.
+
+    Slider drags reapply the blur with the same sigma many times in a row,
+    so kernels are cached. The returned array is read-only.
+    """
+    import cv2
+
+    kernel = cv2.getGaussianKernel(ksize, sigma, ktype=cv2.CV_32F)
+    kernel.flags.writeable = False
+    return kernel
 
 
 @register_filter("gaussian_blur")
@@ -69,15 +146,36 @@ class GaussianBlurFilter(BaseFilter):
         ]
 
     def apply(self, image: np.ndarray, sigma: float = 3.0) -> np.ndarray:
-        def gaussian_blur(arr, sigma):
-            # Handle both RGB (H,W,3) and alpha (H,W,1) arrays
-            if arr.ndim == 3 and arr.shape[2] > 1:
-                return gaussian(arr, sigma=sigma, channel_axis=2)
+        import cv2
+
+        # Same kernel extent (truncate=4) and edge handling as skimage's gaussian
+        ksize = 2 * int(4 * sigma + 0.5) + 1
+
+        if image[:, :, 3].min() == 255:
+            # Premultiplying is a no-op on fully opaque images and replicated
+            # edges keep alpha opaque, so only the color channels are blurred
+            result = self._rgba_output_like(image)
+            if sigma > _IIR_SIGMA_THRESHOLD:
+                blurred = _gaussian_iir(image[:, :, :3].astype(np.float32), sigma)
+                np.clip(blurred, 0, 255, out=blurred)
+                result[:, :, :3] = blurred
             else:
-                # For single channel, squeeze and unsqueeze
-                squeezed = arr.squeeze()
-                blurred = gaussian(squeezed, sigma=sigma)
-                return blurred[:, :, np.newaxis]
+                # Blur the uint8 channels directly, skipping the float32 round trip
+                result[:, :, :3] = cv2.GaussianBlur(
+                    image[:, :, :3], (ksize, ksize), sigmaX=sigma, sigmaY=sigma,
+                    borderType=cv2.BORDER_REPLICATE,
+                )
+            return result
+
+        def gaussian_blur(arr, sigma):
+            if sigma > _IIR_SIGMA_THRESHOLD:
+                return _gaussian_iir(arr, sigma)
+            # Separable float32 passes with a cached kernel (same result as
+            # cv2.GaussianBlur, without its per-call setup); cv2 drops a
+            # trailing singleton channel
+            kernel = _gaussian_kernel(ksize, float(sigma))
+            blurred = cv2.sepFilter2D(arr, -1, kernel, kernel, borderType=cv2.BORDER_REPLICATE)
+            return blurred.reshape(arr.shape)
 
         return apply_blur_alpha_aware(image, gaussian_blur, sigma=sigma)
 
@@ -105,18 +203,56 @@ class BoxBlurFilter(BaseFilter):
         ]
 
     def apply(self, image: np.ndarray, size: int = 5) -> np.ndarray:
+        import cv2
+
         def box_blur(arr, size):
-            if arr.ndim == 3:
-                result = np.zeros_like(arr)
-                for c in range(arr.shape[2]):
-                    result[:, :, c] = ndimage.uniform_filter(arr[:, :, c], size=size, mode='constant', cval=0)
-                return result
-            else:
-                return ndimage.uniform_filter(arr, size=size, mode='constant', cval=0)
+            # All channels in one separable pass; zero padding like uniform_filter's
+            # constant mode, and cv2 drops a trailing singleton channel
+            blurred = cv2.boxFilter(
+                arr, -1, (size, size), normalize=True, borderType=cv2.BORDER_CONSTANT
+            )
+            return blurred.reshape(arr.shape)
 
         return apply_blur_alpha_aware(image, box_blur, size=size)
 
 
+def _median_blur_premultiplied_u8(image: np.ndarray, size: int) -> np.ndarray:
+    """Median-filter an RGBA image in 8-bit premultiplied form.
+
+    OpenCV only supports float medians up to 5x5 and SciPy's float median is
+    very slow for larger windows, while OpenCV's uint8 median is
+    constant-time in the window size. Premultiplied colors are rounded to
+    8 bits, so un-premultiplied colors of barely visible pixels lose some
+    precision. Edges are zero-padded like the float path.
+    """
+    import cv2
+
+    # Pre-multiply RGB by alpha, rounding to uint8
+    alpha = image[:, :, 3:4].astype(np.float32)
+    alpha /= 255
+    rgb = image[:, :, :3] * alpha
+    rgb += 0.5
+    premult = np.empty_like(image)
+    premult[:, :, :3] = rgb
+    premult[:, :, 3] = image[:, :, 3]
+
+    # All four channels in one pass
+    pad = size // 2
+    padded = cv2.copyMakeBorder(premult, pad, pad, pad, pad, cv2.BORDER_CONSTANT, value=0)
+    blurred = cv2.medianBlur(padded, size)[pad:-pad, pad:-pad]
+
+    # Un-premultiply (avoid division by zero)
+    scale = np.maximum(blurred[:, :, 3:4].astype(np.float32), 1e-6)
+    np.divide(255, scale, out=scale)
+    rgb = blurred[:, :, :3] * scale
+    np.clip(rgb, 0, 255, out=rgb)
+
+    result = np.empty_like(image)
+    result[:, :, :3] = rgb
+    result[:, :, 3] = blurred[:, :, 3]
+    return result
+
+
 @register_filter("median_blur")
 class MedianBlurFilter(BaseFilter):
     """Median blur filter - good for noise reduction."""
@@ -143,7 +279,16 @@ class MedianBlurFilter(BaseFilter):
         # Ensure odd kernel size
         size = size if size % 2 == 1 else size + 1
 
+        import cv2
+
         def median_blur(arr, size):
+            if size in (3, 5):
+                # cv2 handles float32 medians for these sizes on all channels at
+                # once; pad with zeros so edges match the constant mode below
+                pad = size // 2
+                padded = cv2.copyMakeBorder(arr, pad, pad, pad, pad, cv2.BORDER_CONSTANT, value=0)
+                blurred = cv2.medianBlur(padded, size)[pad:-pad, pad:-pad]
+                return blurred.reshape(arr.shape)
             if arr.ndim == 3:
                 result = np.zeros_like(arr)
                 for c in range(arr.shape[2]):
@@ -152,9 +297,45 @@ class MedianBlurFilter(BaseFilter):
             else:
                 return ndimage.median_filter(arr, size=size, mode='constant', cval=0)
 
+        if size > 5:
+            return _median_blur_premultiplied_u8(image, size)
+
         return apply_blur_alpha_aware(image, median_blur, size=size)
 
 
+# Above this spatial sigma the guided filter replaces cv2.bilateralFilter,
+# whose cost grows with the square of the window size
+_GUIDED_SIGMA_THRESHOLD = 10
+
+
+def _guided_filter(src: np.ndarray, radius: int, eps: float) -> np.ndarray:
+    """Edge-preserving smoothing of a uint8 image with a self-guided filter.
+
+    Each channel acts as its own guide (He et al.), so the cost per pixel is
+    a handful of box filters regardless of the radius. ``eps`` is the
+    regularization on the 0-1 intensity scale: variations well below its
+    square root are smoothed, stronger edges are kept.
+    """
+    import cv2
+
+    ksize = (2 * radius + 1, 2 * radius + 1)
+
+    def box(arr):
+        return cv2.boxFilter(arr, -1, ksize, borderType=cv2.BORDER_REFLECT).reshape(arr.shape)
+
+    guide = src.astype(np.float32)
+    guide /= 255
+    mean = box(guide)
+    variance = box(guide * guide) - mean * mean
+    a = variance / (variance + eps)
+    b = mean - a * mean
+
+    result = box(a) * guide + box(b)
+    result *= 255
+    result += 0.5
+    return np.clip(result, 0, 255).astype(np.uint8)
+
+
 @register_filter("bilateral_blur")
 class BilateralBlurFilter(BaseFilter):
     """Bilateral filter - edge-preserving smoothing."""
@@ -196,12 +377,19 @@ class BilateralBlurFilter(BaseFilter):
         # Pre-multiply RGB by alpha
         rgb_premult = (rgb * alpha * 255).astype(np.uint8)
 
-        # Apply bilateral filter to pre-multiplied RGB
-        filtered_premult = cv2.bilateralFilter(rgb_premult, d=-1, sigmaColor=sigma_color, sigmaSpace=sigma_spatial)
+        if sigma_spatial > _GUIDED_SIGMA_THRESHOLD:
+            def smooth(arr):
+                return _guided_filter(arr, int(sigma_spatial), (sigma_color / 255) ** 2)
+        else:
+            def smooth(arr):
+                return cv2.bilateralFilter(arr, d=-1, sigmaColor=sigma_color, sigmaSpace=sigma_spatial)
+
+        # Apply edge-preserving smoothing to pre-multiplied RGB
+        filtered_premult = smooth(rgb_premult)
 
         # Also blur alpha for consistency
-        alpha_uint8 = (alpha * 255).astype(np.uint8)
-        alpha_blurred = cv2.bilateralFilter(alpha_uint8, d=-1, sigmaColor=sigma_color, sigmaSpace=sigma_spatial)
+        alpha_uint8 = (alpha[:, :, 0] * 255).astype(np.uint8)
+        alpha_blurred = smooth(alpha_uint8)
 
         # Un-premultiply
         filtered_float = filtered_premult.astype(np.float32) / 255.0
@@ -211,12 +399,64 @@ class BilateralBlurFilter(BaseFilter):
         rgb_result = np.clip(rgb_result, 0, 1)
 
         # Convert back to uint8
-        rgb_uint8 = (rgb_result * 255).astype(np.uint8)
-
-        result = np.concatenate([rgb_uint8, alpha_blurred], axis=2)
+        result = np.empty_like(image)
+        result[:, :, :3] = rgb_result * 255
+        result[:, :, 3] = alpha_blurred
         return result
 
 
+@lru_cache(maxsize=128)
+def _motion_kernel(size: int, angle: int) -> np.ndarray:
+    """Build the normalized line kernel for a motion blur.
+
+    Slider drags reapply the filter with the same size and angle many times
+    in a row, so kernels are cached. The returned array is read-only.
+    """
+    import cv2
+
+    # Create motion blur kernel
+    kernel = np.zeros((size, size))
+    kernel[size // 2, :] = 1.0 / size
+
+    # Rotate kernel by angle; a zero rotation leaves the line untouched
+    if angle:
+        center = (size / 2, size / 2)
+        rotation_matrix = cv2.getRotationMatrix2D(center, angle, 1.0)
+        kernel = cv2.warpAffine(kernel, rotation_matrix, (size, size))
+        kernel /= kernel.sum()  # Normalize
+
+    kernel = kernel.astype(np.float32)
+    kernel.flags.writeable = False
+    return kernel
+
+
+@lru_cache(maxsize=128)
+def _separable_motion_kernel(size: int, angle: int) -> tuple[np.ndarray, np.ndarray] | None:
+    """Split an axis-aligned motion kernel into (kernel_x, kernel_y) 1-D parts.
+
+    Applies when the line lies entirely in the anchor row or column (angle
+    0 and, depending on the size, the other right angles); returns None for
+    any other kernel, and for tiny ones where the 2-D filter is faster.
+    """
+    if size <= 3:
+        return None
+
+    kernel = _motion_kernel(size, angle)
+    center = size // 2
+    off_center = np.arange(size) != center
+    unit = np.ones(1, dtype=np.float32)
+    if not kernel[off_center].any():
+        parts = (kernel[center].copy(), unit)
+    elif not kernel[:, off_center].any():
+        parts = (unit, kernel[:, center].copy())
+    else:
+        return None
+
+    for part in parts:
+        part.flags.writeable = False
+    return parts
+
+
 @register_filter("motion_blur")
 class MotionBlurFilter(BaseFilter):
     """Motion blur filter."""
@@ -251,16 +491,18 @@ class MotionBlurFilter(BaseFilter):
     def apply(self, image: np.ndarray, size: int = 15, angle: int = 0) -> np.ndarray:
         import cv2
 
-        # Create motion blur kernel
-        kernel = np.zeros((size, size))
-        kernel[size // 2, :] = np.ones(size)
-        kernel = kernel / size
+        size = int(size)
+        angle = int(angle) % 360
+        separable = _separable_motion_kernel(size, angle)
+        if separable is not None:
+            # A horizontal or vertical line is a 1-D box: two cheap passes
+            def blur(arr):
+                return cv2.sepFilter2D(arr, -1, *separable)
+        else:
+            kernel = _motion_kernel(size, angle)
 
-        # Rotate kernel by angle
-        center = (size / 2, size / 2)
-        rotation_matrix = cv2.getRotationMatrix2D(center, angle, 1.0)
-        kernel = cv2.warpAffine(kernel, rotation_matrix, (size, size))
-        kernel = kernel / kernel.sum()  # Normalize
+            def blur(arr):
+                return cv2.filter2D(arr, -1, kernel)
 
         # Separate channels
         rgb = image[:, :, :3].astype(np.float32) / 255.0
@@ -270,21 +512,21 @@ class MotionBlurFilter(BaseFilter):
         rgb_premult = (rgb * alpha * 255).astype(np.uint8)
 
         # Apply motion blur to pre-multiplied RGB
-        filtered_premult = cv2.filter2D(rgb_premult, -1, kernel)
+        filtered_premult = blur(rgb_premult)
 
         # Also blur alpha
-        alpha_uint8 = (alpha * 255).astype(np.uint8)
-        alpha_blurred = cv2.filter2D(alpha_uint8, -1, kernel)
+        alpha_uint8 = (alpha[:, :, 0] * 255).astype(np.uint8)
+        alpha_blurred = blur(alpha_uint8)
 
         # Un-premultiply
         filtered_float = filtered_premult.astype(np.float32) / 255.0
         alpha_float = alpha_blurred.astype(np.float32) / 255.0
         alpha_safe = np.maximum(alpha_float, 1e-6)
-        rgb_result = filtered_float / alpha_safe
+        rgb_result = filtered_float / alpha_safe[:, :, np.newaxis]
         rgb_result = np.clip(rgb_result, 0, 1)
 
         # Convert back to uint8
-        rgb_uint8 = (rgb_result * 255).astype(np.uint8)
-
-        result = np.concatenate([rgb_uint8, alpha_blurred], axis=2)
+        result = np.empty_like(image)
+        result[:, :, :3] = rgb_result * 255
+        result[:, :, 3] = alpha_blurred
         return result
@@ -1,12 +1,75 @@
 """Color adjustment filters."""
 
+from functools import lru_cache
+
 import numpy as np
-from skimage import color as skcolor
 
 from .base import BaseFilter
 from .registry import register_filter
 
 
+def _apply_rgb_lut(image: np.ndarray, table: np.ndarray) -> np.ndarray:
+    """Map the RGB channels of an RGBA image through a 256-entry lookup table.
+
+    ``table`` holds one uint8 entry per input value, either shared by all
+    color channels (shape (256,)) or per channel (shape (256, 3)). Alpha
+    passes through unchanged; the whole image is mapped in one cv2.LUT pass.
+    """
+    import cv2
+
+    lut = np.empty((256, 1, 4), dtype=np.uint8)
+    lut[:, 0, :3] = table.reshape(256, -1)
+    lut[:, 0, 3] = np.arange(256)
+    return cv2.LUT(image, lut)
+
+
+# RGBA color matrix writing the luminance (the BT.709 weights also used by
+# skimage's rgb2gray) to all color channels; alpha passes through
+_GRAYSCALE_MATRIX = np.array(
+    [
+        [0.2125, 0.7154, 0.0721, 0],
+        [0.2125, 0.7154, 0.0721, 0],
+        [0.2125, 0.7154, 0.0721, 0],
+        [0, 0, 0, 1],
+    ]
+)
+
+
+def _histogram_percentiles(hist: np.ndarray, percentiles: tuple[float, ...]) -> list[float]:
+    """Percentiles of the data behind a 256-bin histogram of uint8 values.
+
+    Matches ``np.percentile``'s default linear interpolation between the
+    neighbouring order statistics, without materializing or sorting the data.
+    """
+    cumulative = np.cumsum(hist)
+    count = int(cumulative[-1])
+    result = []
+    for q in percentiles:
+        position = (count - 1) * (q / 100)
+        lower = int(np.floor(position))
+        upper = min(lower + 1, count - 1)
+        low_value, high_value = np.searchsorted(cumulative, (lower, upper), side="right")
+        result.append(float(low_value + (high_value - low_value) * (position - lower)))
+    return result
+
+
+def _equalize_lut(hist: np.ndarray) -> np.ndarray:
+    """Lookup table equalizing a 256-bin histogram the way cv2.equalizeHist does."""
+    hist = hist.astype(np.int64)
+    first = int(np.flatnonzero(hist)[0])
+    total = int(hist.sum())
+    if hist[first] == total:
+        # Single-valued channel: equalizeHist maps everything to that value
+        return np.full(256, first, dtype=np.uint8)
+
+    # Cumulative count above the lowest occupied bin, scaled in float32
+    scale = np.float32(255 / (total - hist[first]))
+    cumulative = (np.cumsum(hist) - hist[first]).astype(np.float32)
+    table = np.rint(cumulative * scale)
+    table[:first] = 0
+    return np.clip(table, 0, 255).astype(np.uint8)
+
+
 @register_filter("grayscale")
 class GrayscaleFilter(BaseFilter):
     """Convert to grayscale."""
@@ -20,12 +83,9 @@ class GrayscaleFilter(BaseFilter):
         return []
 
     def apply(self, image: np.ndarray) -> np.ndarray:
-        rgb = image[:, :, :3]
-        gray = skcolor.rgb2gray(rgb)
-        gray = (gray * 255).astype(np.uint8)
+        import cv2
 
-        result = np.stack([gray, gray, gray, image[:, :, 3]], axis=2)
-        return result
+        return cv2.transform(image, _GRAYSCALE_MATRIX)
 
 
 @register_filter("invert")
@@ -41,9 +101,11 @@ class InvertFilter(BaseFilter):
         return []
 
     def apply(self, image: np.ndarray) -> np.ndarray:
-        result = image.copy()
-        result[:, :, :3] = 255 - image[:, :, :3]
-        return result
+        import cv2
+
+        # For uint8, 255 - x is a bitwise NOT; XOR with 255 flips the color
+        # channels of the whole RGBA buffer in one pass and leaves alpha as is
+        return cv2.bitwise_xor(image, (255, 255, 255, 0))
 
 
 @register_filter("brightness_contrast")
@@ -78,18 +140,40 @@ class BrightnessContrastFilter(BaseFilter):
         ]
 
     def apply(self, image: np.ndarray, brightness: int = 0, contrast: int = 0) -> np.ndarray:
-        result = image.copy().astype(np.float32)
+        # The adjustment only depends on each channel value, so compute it
+        # once per possible value
+        table = np.arange(256, dtype=np.float32)
 
         # Apply brightness
-        result[:, :, :3] += brightness * 2.55  # Scale to 0-255 range
+        table += brightness * 2.55  # Scale to 0-255 range
 
         # Apply contrast
         factor = (259 * (contrast + 255)) / (255 * (259 - contrast))
-        result[:, :, :3] = factor * (result[:, :, :3] - 128) + 128
+        table = factor * (table - 128) + 128
 
         # Clamp and convert back
-        result = np.clip(result, 0, 255).astype(np.uint8)
-        return result
+        table = np.clip(table, 0, 255).astype(np.uint8)
+        return _apply_rgb_lut(image, table)
+
+
+# Sepia transformation matrix (rows produce R, G, B from R, G, B)
+_SEPIA = np.array(
+    [
+        [0.393, 0.769, 0.189],
+        [0.349, 0.686, 0.168],
+        [0.272, 0.534, 0.131],
+    ]
+)
+
+
+@lru_cache(maxsize=32)
+def _sepia_matrix(intensity: float) -> np.ndarray:
+    """4x4 RGBA color matrix blending identity with sepia; alpha passes through."""
+    factor = intensity / 100.0
+    matrix = np.eye(4)
+    matrix[:3, :3] = (1 - factor) * np.eye(3) + factor * _SEPIA
+    matrix.flags.writeable = False
+    return matrix
 
 
 @register_filter("sepia")
@@ -115,23 +199,30 @@ class SepiaFilter(BaseFilter):
         ]
 
     def apply(self, image: np.ndarray, intensity: int = 100) -> np.ndarray:
-        result = image.copy().astype(np.float32)
-        factor = intensity / 100.0
+        import cv2
+
+        return cv2.transform(image, _sepia_matrix(float(intensity)))
+
 
-        r = result[:, :, 0]
-        g = result[:, :, 1]
-        b = result[:, :, 2]
+@lru_cache(maxsize=32)
+def _hsv_adjustment_lut(hue: float, saturation: float, lightness: float) -> np.ndarray:
+    """Per-channel lookup table applying a hue/saturation/lightness shift to 8-bit HSV."""
+    values = np.arange(256, dtype=np.float32)
+    table = np.empty((256, 1, 3), dtype=np.float32)
 
-        # Sepia transformation matrix
-        new_r = r * (1 - factor) + (r * 0.393 + g * 0.769 + b * 0.189) * factor
-        new_g = g * (1 - factor) + (r * 0.349 + g * 0.686 + b * 0.168) * factor
-        new_b = b * (1 - factor) + (r * 0.272 + g * 0.534 + b * 0.131) * factor
+    # Adjust hue (wraps around)
+    table[:, 0, 0] = (values + hue / 2) % 180
 
-        result[:, :, 0] = np.clip(new_r, 0, 255)
-        result[:, :, 1] = np.clip(new_g, 0, 255)
-        result[:, :, 2] = np.clip(new_b, 0, 255)
+    # Adjust saturation
+    table[:, 0, 1] = values * (1 + saturation / 100)
 
-        return result.astype(np.uint8)
+    # Adjust lightness (value)
+    table[:, 0, 2] = values + lightness * 2.55
+
+    # Clamp values
+    lut = np.clip(table, 0, 255).astype(np.uint8)
+    lut.flags.writeable = False
+    return lut
 
 
 @register_filter("hue_saturation")
@@ -178,26 +269,12 @@ class HueSaturationFilter(BaseFilter):
         import cv2
 
         rgb = image[:, :, :3]
-        hsv = cv2.cvtColor(rgb, cv2.COLOR_RGB2HSV).astype(np.float32)
-
-        # Adjust hue (wraps around)
-        hsv[:, :, 0] = (hsv[:, :, 0] + hue / 2) % 180
-
-        # Adjust saturation
-        if saturation >= 0:
-            hsv[:, :, 1] = hsv[:, :, 1] * (1 + saturation / 100)
-        else:
-            hsv[:, :, 1] = hsv[:, :, 1] * (1 + saturation / 100)
-
-        # Adjust lightness (value)
-        hsv[:, :, 2] = hsv[:, :, 2] + lightness * 2.55
+        hsv = cv2.cvtColor(rgb, cv2.COLOR_RGB2HSV)
+        hsv = cv2.LUT(hsv, _hsv_adjustment_lut(hue, saturation, lightness))
 
-        # Clamp values
-        hsv[:, :, 1] = np.clip(hsv[:, :, 1], 0, 255)
-        hsv[:, :, 2] = np.clip(hsv[:, :, 2], 0, 255)
-
-        result_rgb = cv2.cvtColor(hsv.astype(np.uint8), cv2.COLOR_HSV2RGB)
-        result = np.concatenate([result_rgb, image[:, :, 3:4]], axis=2)
+        result_rgb = cv2.cvtColor(hsv, cv2.COLOR_HSV2RGB)
+        result = self._rgba_output_like(image)
+        result[:, :, :3] = result_rgb
         return result
 
 
@@ -242,14 +319,15 @@ class ColorBalanceFilter(BaseFilter):
         ]
 
     def apply(self, image: np.ndarray, red: int = 0, green: int = 0, blue: int = 0) -> np.ndarray:
-        result = image.copy().astype(np.float32)
+        values = np.arange(256, dtype=np.float32)
+        table = np.empty((256, 3), dtype=np.float32)
 
         # Apply color shifts
-        result[:, :, 0] = np.clip(result[:, :, 0] + red * 2.55, 0, 255)
-        result[:, :, 1] = np.clip(result[:, :, 1] + green * 2.55, 0, 255)
-        result[:, :, 2] = np.clip(result[:, :, 2] + blue * 2.55, 0, 255)
+        table[:, 0] = np.clip(values + red * 2.55, 0, 255)
+        table[:, 1] = np.clip(values + green * 2.55, 0, 255)
+        table[:, 2] = np.clip(values + blue * 2.55, 0, 255)
 
-        return result.astype(np.uint8)
+        return _apply_rgb_lut(image, table.astype(np.uint8))
 
 
 @register_filter("gamma_correction")
@@ -277,13 +355,9 @@ class GammaCorrectionFilter(BaseFilter):
     def apply(self, image: np.ndarray, gamma: float = 1.0) -> np.ndarray:
         # Build lookup table
         inv_gamma = 1.0 / gamma
-        table = np.array([(i / 255.0) ** inv_gamma * 255 for i in range(256)]).astype(np.uint8)
-
-        result = image.copy()
-        for c in range(3):
-            result[:, :, c] = table[image[:, :, c]]
+        table = ((np.arange(256) / 255.0) ** inv_gamma * 255).astype(np.uint8)
 
-        return result
+        return _apply_rgb_lut(image, table)
 
 
 @register_filter("auto_contrast")
@@ -309,14 +383,23 @@ class AutoContrastFilter(BaseFilter):
         ]
 
     def apply(self, image: np.ndarray, clip_percent: float = 1.0) -> np.ndarray:
-        from skimage import exposure
+        import cv2
 
-        result = image.copy()
+        values = np.arange(256, dtype=np.float64)
+        table = np.empty((256, 3), dtype=np.uint8)
         for c in range(3):
-            p_low, p_high = np.percentile(image[:, :, c], (clip_percent, 100 - clip_percent))
-            result[:, :, c] = exposure.rescale_intensity(image[:, :, c], in_range=(p_low, p_high))
+            # uint8 data: read the percentiles off the cumulative histogram
+            # instead of sorting the channel
+            hist = cv2.calcHist([image], [c], None, [256], [0, 256])
+            p_low, p_high = _histogram_percentiles(hist.ravel(), (clip_percent, 100 - clip_percent))
 
-        return result
+            # Same stretch as skimage's rescale_intensity, once per value
+            stretched = np.clip(values, p_low, p_high)
+            if p_low != p_high:
+                stretched = (stretched - p_low) / (p_high - p_low) * 255
+            table[:, c] = np.clip(stretched, 0, 255)
+
+        return _apply_rgb_lut(image, table)
 
 
 @register_filter("equalize_histogram")
@@ -342,19 +425,21 @@ class EqualizeHistogramFilter(BaseFilter):
     def apply(self, image: np.ndarray, method: str = "global") -> np.ndarray:
         import cv2
 
-        result = image.copy()
-
         if method == "adaptive":
             # CLAHE (Contrast Limited Adaptive Histogram Equalization)
+            result = self._rgba_output_like(image)
             clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
             for c in range(3):
                 result[:, :, c] = clahe.apply(image[:, :, c])
-        else:
-            # Global histogram equalization
-            for c in range(3):
-                result[:, :, c] = cv2.equalizeHist(image[:, :, c])
+            return result
 
-        return result
+        # Global histogram equalization: one table per channel, then a
+        # single pass over the image
+        table = np.empty((256, 3), dtype=np.uint8)
+        for c in range(3):
+            hist = cv2.calcHist([image], [c], None, [256], [0, 256])
+            table[:, c] = _equalize_lut(hist.ravel())
+        return _apply_rgb_lut(image, table)
 
 
 @register_filter("channel_mixer")
@@ -392,16 +477,42 @@ class ChannelMixerFilter(BaseFilter):
         ]
 
     def apply(self, image: np.ndarray, red_channel: str = "red", green_channel: str = "green", blue_channel: str = "blue") -> np.ndarray:
-        channel_map = {"red": 0, "green": 1, "blue": 2}
+        import cv2
 
-        result = image.copy()
-        result[:, :, 0] = image[:, :, channel_map[red_channel]]
-        result[:, :, 1] = image[:, :, channel_map[green_channel]]
-        result[:, :, 2] = image[:, :, channel_map[blue_channel]]
+        channel_map = {"red": 0, "green": 1, "blue": 2}
 
+        # Copy all four channels in one pass; pairs are (source, destination)
+        result = np.empty_like(image)
+        cv2.mixChannels(
+            [image],
+            [result],
+            [
+                channel_map[red_channel], 0,
+                channel_map[green_channel], 1,
+                channel_map[blue_channel], 2,
+                3, 3,
+            ],
+        )
         return result
 
 
+@lru_cache(maxsize=32)
+def _vibrance_lut(amount: float) -> np.ndarray:
+    """Lookup table for 8-bit HSV boosting the saturation of muted colors most."""
+    values = np.arange(256, dtype=np.float32)
+    table = np.empty((256, 1, 3), dtype=np.float32)
+    table[:, 0, 0] = values
+    table[:, 0, 2] = values
+
+    # Vibrance boosts less saturated colors more
+    boost = (1 - values / 255.0) * (amount / 100.0)
+    table[:, 0, 1] = values * (1 + boost)
+
+    lut = np.clip(table, 0, 255).astype(np.uint8)
+    lut.flags.writeable = False
+    return lut
+
+
 @register_filter("vibrance")
 class VibranceFilter(BaseFilter):
     """Adjust color vibrance."""
@@ -427,16 +538,13 @@ class VibranceFilter(BaseFilter):
     def apply(self, image: np.ndarray, amount: int = 25) -> np.ndarray:
         import cv2
 
-        rgb = image[:, :, :3].astype(np.float32)
-        hsv = cv2.cvtColor(rgb.astype(np.uint8), cv2.COLOR_RGB2HSV).astype(np.float32)
-
-        # Vibrance boosts less saturated colors more
-        sat = hsv[:, :, 1] / 255.0
-        boost = (1 - sat) * (amount / 100.0)
-        hsv[:, :, 1] = np.clip(hsv[:, :, 1] * (1 + boost), 0, 255)
+        rgb = image[:, :, :3]
+        hsv = cv2.cvtColor(rgb, cv2.COLOR_RGB2HSV)
+        hsv = cv2.LUT(hsv, _vibrance_lut(amount))
 
-        result_rgb = cv2.cvtColor(hsv.astype(np.uint8), cv2.COLOR_HSV2RGB)
-        result = np.concatenate([result_rgb, image[:, :, 3:4]], axis=2)
+        result_rgb = cv2.cvtColor(hsv, cv2.COLOR_HSV2RGB)
+        result = self._rgba_output_like(image)
+        result[:, :, :3] = result_rgb
         return result
 
 
@@ -463,15 +571,16 @@ class TemperatureFilter(BaseFilter):
         ]
 
     def apply(self, image: np.ndarray, temperature: int = 0) -> np.ndarray:
-        result = image.copy().astype(np.float32)
+        values = np.arange(256, dtype=np.float32)
+        table = np.repeat(values[:, np.newaxis], 3, axis=1)
 
         if temperature > 0:
             # Warm: increase red, decrease blue
-            result[:, :, 0] = np.clip(result[:, :, 0] + temperature * 0.5, 0, 255)
-            result[:, :, 2] = np.clip(result[:, :, 2] - temperature * 0.3, 0, 255)
+            table[:, 0] = np.clip(values + temperature * 0.5, 0, 255)
+            table[:, 2] = np.clip(values - temperature * 0.3, 0, 255)
         else:
             # Cool: decrease red, increase blue
-            result[:, :, 0] = np.clip(result[:, :, 0] + temperature * 0.3, 0, 255)
-            result[:, :, 2] = np.clip(result[:, :, 2] - temperature * 0.5, 0, 255)
+            table[:, 0] = np.clip(values + temperature * 0.3, 0, 255)
+            table[:, 2] = np.clip(values - temperature * 0.5, 0, 255)
 
-        return result.astype(np.uint8)
+        return _apply_rgb_lut(image, table.astype(np.uint8))
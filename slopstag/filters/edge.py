@@ -1,12 +1,40 @@
 """Edge detection filters."""
 
 import numpy as np
-from skimage import filters
 from skimage.feature import canny
 
 from .base import BaseFilter
 from .registry import register_filter
 
+# Smoothing weights of the 3x3 gradient operators, applied across the
+# derivative direction (same normalization as skimage.filters)
+_SOBEL_SMOOTH = np.array([1, 2, 1], dtype=np.float32) / 4
+_PREWITT_SMOOTH = np.array([1, 1, 1], dtype=np.float32) / 3
+_SCHARR_SMOOTH = np.array([3, 10, 3], dtype=np.float32) / 16
+_DERIVATIVE = np.array([-1, 0, 1], dtype=np.float32)
+
+
+def _gradient_magnitude(gray: np.ndarray, smooth: np.ndarray) -> np.ndarray:
+    """Edge magnitude of an 8-bit gray image as uint8.
+
+    Matches skimage's sobel/prewitt/scharr on the 0-255 scale:
+    sqrt((gx^2 + gy^2) / 2) with reflected borders. The division by 2 is
+    folded into the smoothing weights.
+    """
+    import cv2
+
+    smooth = smooth / np.float32(np.sqrt(2))
+    gx = cv2.sepFilter2D(gray, cv2.CV_32F, _DERIVATIVE, smooth, borderType=cv2.BORDER_REFLECT)
+    gy = cv2.sepFilter2D(gray, cv2.CV_32F, smooth, _DERIVATIVE, borderType=cv2.BORDER_REFLECT)
+    return np.clip(cv2.magnitude(gx, gy), 0, 255).astype(np.uint8)
+
+
+def _gray_to_rgba(gray: np.ndarray, image: np.ndarray) -> np.ndarray:
+    """Interleave a gray result into RGB alongside the alpha of ``image``."""
+    import cv2
+
+    return cv2.merge((gray, gray, gray, image[:, :, 3]))
+
 
 @register_filter("sobel_edge")
 class SobelEdgeFilter(BaseFilter):
@@ -22,14 +50,12 @@ class SobelEdgeFilter(BaseFilter):
 
     def apply(self, image: np.ndarray) -> np.ndarray:
         # Convert to grayscale for edge detection
-        gray = np.mean(image[:, :, :3], axis=2).astype(np.float32) / 255.0
+        gray = self._to_gray_u8(image)
 
-        edges = filters.sobel(gray)
-        edges = (np.clip(edges, 0, 1) * 255).astype(np.uint8)
+        edges = _gradient_magnitude(gray, _SOBEL_SMOOTH)
 
         # Convert back to RGBA
-        result = np.stack([edges, edges, edges, image[:, :, 3]], axis=2)
-        return result
+        return _gray_to_rgba(edges, image)
 
 
 @register_filter("canny_edge")
@@ -79,12 +105,11 @@ class CannyEdgeFilter(BaseFilter):
         low_threshold: float = 0.1,
         high_threshold: float = 0.2,
     ) -> np.ndarray:
-        gray = np.mean(image[:, :, :3], axis=2).astype(np.float32) / 255.0
+        gray = self._to_gray_u8(image).astype(np.float32) * (1.0 / 255.0)
         edges = canny(gray, sigma=sigma, low_threshold=low_threshold, high_threshold=high_threshold)
         edges = (edges * 255).astype(np.uint8)
 
-        result = np.stack([edges, edges, edges, image[:, :, 3]], axis=2)
-        return result
+        return _gray_to_rgba(edges, image)
 
 
 @register_filter("laplacian_edge")
@@ -110,15 +135,14 @@ class LaplacianEdgeFilter(BaseFilter):
     def apply(self, image: np.ndarray, ksize: str = "3") -> np.ndarray:
         import cv2
 
-        gray = np.mean(image[:, :, :3], axis=2).astype(np.uint8)
+        gray = self._to_gray_u8(image)
 
         # Apply Laplacian
         laplacian = cv2.Laplacian(gray, cv2.CV_64F, ksize=int(ksize))
         edges = np.abs(laplacian)
         edges = (np.clip(edges / edges.max() * 255, 0, 255) if edges.max() > 0 else edges).astype(np.uint8)
 
-        result = np.stack([edges, edges, edges, image[:, :, 3]], axis=2)
-        return result
+        return _gray_to_rgba(edges, image)
 
 
 @register_filter("prewitt_edge")
@@ -134,14 +158,10 @@ class PrewittEdgeFilter(BaseFilter):
         return []
 
     def apply(self, image: np.ndarray) -> np.ndarray:
-        from skimage.filters import prewitt
+        gray = self._to_gray_u8(image)
+        edges = _gradient_magnitude(gray, _PREWITT_SMOOTH)
 
-        gray = np.mean(image[:, :, :3], axis=2).astype(np.float32) / 255.0
-        edges = prewitt(gray)
-        edges = (np.clip(edges, 0, 1) * 255).astype(np.uint8)
-
-        result = np.stack([edges, edges, edges, image[:, :, 3]], axis=2)
-        return result
+        return _gray_to_rgba(edges, image)
 
 
 @register_filter("scharr_edge")
@@ -157,14 +177,10 @@ class ScharrEdgeFilter(BaseFilter):
         return []
 
     def apply(self, image: np.ndarray) -> np.ndarray:
-        from skimage.filters import scharr
-
-        gray = np.mean(image[:, :, :3], axis=2).astype(np.float32) / 255.0
-        edges = scharr(gray)
-        edges = (np.clip(edges, 0, 1) * 255).astype(np.uint8)
+        gray = self._to_gray_u8(image)
+        edges = _gradient_magnitude(gray, _SCHARR_SMOOTH)
 
-        result = np.stack([edges, edges, edges, image[:, :, 3]], axis=2)
-        return result
+        return _gray_to_rgba(edges, image)
 
 
 @register_filter("find_contours")
@@ -201,7 +217,7 @@ class FindContoursFilter(BaseFilter):
     def apply(self, image: np.ndarray, threshold: int = 128, line_width: int = 2) -> np.ndarray:
         import cv2
 
-        gray = np.mean(image[:, :, :3], axis=2).astype(np.uint8)
+        gray = self._to_gray_u8(image)
 
         # Threshold
         _, binary = cv2.threshold(gray, threshold, 255, cv2.THRESH_BINARY)
@@ -1,5 +1,7 @@
 """Morphological operation filters."""
 
+from functools import lru_cache
+
 import numpy as np
 import cv2
 
@@ -7,6 +9,81 @@ from .base import BaseFilter
 from .registry import register_filter
 
 
+_SHAPES = {
+    "rect": cv2.MORPH_RECT,
+    "ellipse": cv2.MORPH_ELLIPSE,
+    "cross": cv2.MORPH_CROSS,
+}
+
+
+@lru_cache(maxsize=64)
+def _structuring_element(shape: str, size: int) -> np.ndarray:
+    """Build a square structuring element of the named shape.
+
+    Slider drags reapply the filter with the same kernel many times in a
+    row, so elements are cached. The returned array is read-only.
+    """
+    kernel = cv2.getStructuringElement(_SHAPES.get(shape, cv2.MORPH_RECT), (size, size))
+    kernel.flags.writeable = False
+    return kernel
+
+
+# Large elliptical kernels cost O(size^2) per pixel. From this effective
+# radius on (half the kernel size times the iterations) they are replaced
+# by an octagon built from repeated 3x3 steps, which costs O(size)
+_OCTAGON_MIN_RADIUS = 10
+_RECT_3X3 = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 3))
+_CROSS_3X3 = cv2.getStructuringElement(cv2.MORPH_CROSS, (3, 3))
+
+# Erosion/dilation stages making up the operations the octagon supports
+_OCTAGON_STAGES = {
+    cv2.MORPH_ERODE: (cv2.erode,),
+    cv2.MORPH_DILATE: (cv2.dilate,),
+    cv2.MORPH_OPEN: (cv2.erode, cv2.dilate),
+    cv2.MORPH_CLOSE: (cv2.dilate, cv2.erode),
+}
+
+
+def _octagon_morphology(image: np.ndarray, op: int, radius: int) -> np.ndarray:
+    """Approximate an operation with a disc of the given radius by an octagon.
+
+    A disc is a Minkowski sum of 3x3 squares and 3x3 crosses; about 41%
+    square steps (sqrt(2) - 1) give the regular octagon closest to it.
+    Within each stage the steps commute, so they run as two iterated calls.
+    """
+    rect_steps = round(radius * (np.sqrt(2) - 1))
+    result = image
+    for stage in _OCTAGON_STAGES[op]:
+        result = stage(result, _RECT_3X3, iterations=rect_steps)
+        result = stage(result, _CROSS_3X3, iterations=radius - rect_steps)
+    return result
+
+
+def _morphology_rgb(
+    image: np.ndarray, op: int, kernel_size: int, shape: str = "rect", iterations: int = 1
+) -> np.ndarray:
+    """Apply a morphological operation to the color channels of an RGBA image.
+
+    OpenCV's vectorized path needs contiguous pixels, so the whole RGBA
+    buffer is processed (much faster than a strided RGB view) and the
+    original alpha is put back afterwards.
+    """
+    radius = (kernel_size - 1) // 2 * iterations
+    if (
+        shape == "ellipse"
+        and op in _OCTAGON_STAGES
+        and kernel_size % 2 == 1
+        and kernel_size >= 7
+        and radius >= _OCTAGON_MIN_RADIUS
+    ):
+        result = _octagon_morphology(image, op, radius)
+    else:
+        kernel = _structuring_element(shape, int(kernel_size))
+        result = cv2.morphologyEx(image, op, kernel, iterations=iterations)
+    result[:, :, 3] = image[:, :, 3]
+    return result
+
+
 @register_filter("erode")
 class ErodeFilter(BaseFilter):
     """Erosion morphological filter."""
@@ -46,16 +123,7 @@ class ErodeFilter(BaseFilter):
         ]
 
     def apply(self, image: np.ndarray, kernel_size: int = 3, iterations: int = 1, shape: str = "rect") -> np.ndarray:
-        shapes = {
-            "rect": cv2.MORPH_RECT,
-            "ellipse": cv2.MORPH_ELLIPSE,
-            "cross": cv2.MORPH_CROSS,
-        }
-        kernel = cv2.getStructuringElement(shapes.get(shape, cv2.MORPH_RECT), (kernel_size, kernel_size))
-
-        result = image.copy()
-        result[:, :, :3] = cv2.erode(image[:, :, :3], kernel, iterations=iterations)
-        return result
+        return _morphology_rgb(image, cv2.MORPH_ERODE, kernel_size, shape, iterations=iterations)
 
 
 @register_filter("dilate")
@@ -97,16 +165,7 @@ class DilateFilter(BaseFilter):
         ]
 
     def apply(self, image: np.ndarray, kernel_size: int = 3, iterations: int = 1, shape: str = "rect") -> np.ndarray:
-        shapes = {
-            "rect": cv2.MORPH_RECT,
-            "ellipse": cv2.MORPH_ELLIPSE,
-            "cross": cv2.MORPH_CROSS,
-        }
-        kernel = cv2.getStructuringElement(shapes.get(shape, cv2.MORPH_RECT), (kernel_size, kernel_size))
-
-        result = image.copy()
-        result[:, :, :3] = cv2.dilate(image[:, :, :3], kernel, iterations=iterations)
-        return result
+        return _morphology_rgb(image, cv2.MORPH_DILATE, kernel_size, shape, iterations=iterations)
 
 
 @register_filter("morphology_open")
@@ -139,16 +198,7 @@ class OpenFilter(BaseFilter):
         ]
 
     def apply(self, image: np.ndarray, kernel_size: int = 3, shape: str = "rect") -> np.ndarray:
-        shapes = {
-            "rect": cv2.MORPH_RECT,
-            "ellipse": cv2.MORPH_ELLIPSE,
-            "cross": cv2.MORPH_CROSS,
-        }
-        kernel = cv2.getStructuringElement(shapes.get(shape, cv2.MORPH_RECT), (kernel_size, kernel_size))
-
-        result = image.copy()
-        result[:, :, :3] = cv2.morphologyEx(image[:, :, :3], cv2.MORPH_OPEN, kernel)
-        return result
+        return _morphology_rgb(image, cv2.MORPH_OPEN, kernel_size, shape)
 
 
 @register_filter("morphology_close")
@@ -181,16 +231,7 @@ class CloseFilter(BaseFilter):
         ]
 
     def apply(self, image: np.ndarray, kernel_size: int = 3, shape: str = "rect") -> np.ndarray:
-        shapes = {
-            "rect": cv2.MORPH_RECT,
-            "ellipse": cv2.MORPH_ELLIPSE,
-            "cross": cv2.MORPH_CROSS,
-        }
-        kernel = cv2.getStructuringElement(shapes.get(shape, cv2.MORPH_RECT), (kernel_size, kernel_size))
-
-        result = image.copy()
-        result[:, :, :3] = cv2.morphologyEx(image[:, :, :3], cv2.MORPH_CLOSE, kernel)
-        return result
+        return _morphology_rgb(image, cv2.MORPH_CLOSE, kernel_size, shape)
 
 
 @register_filter("morphology_gradient")
@@ -216,11 +257,7 @@ class MorphologyGradientFilter(BaseFilter):
         ]
 
     def apply(self, image: np.ndarray, kernel_size: int = 3) -> np.ndarray:
-        kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (kernel_size, kernel_size))
-
-        result = image.copy()
-        result[:, :, :3] = cv2.morphologyEx(image[:, :, :3], cv2.MORPH_GRADIENT, kernel)
-        return result
+        return _morphology_rgb(image, cv2.MORPH_GRADIENT, kernel_size)
 
 
 @register_filter("tophat")
@@ -246,11 +283,7 @@ class TopHatFilter(BaseFilter):
         ]
 
     def apply(self, image: np.ndarray, kernel_size: int = 9) -> np.ndarray:
-        kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (kernel_size, kernel_size))
-
-        result = image.copy()
-        result[:, :, :3] = cv2.morphologyEx(image[:, :, :3], cv2.MORPH_TOPHAT, kernel)
-        return result
+        return _morphology_rgb(image, cv2.MORPH_TOPHAT, kernel_size)
 
 
 @register_filter("blackhat")
@@ -276,8 +309,4 @@ class BlackHatFilter(BaseFilter):
         ]
 
     def apply(self, image: np.ndarray, kernel_size: int = 9) -> np.ndarray:
-        kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (kernel_size, kernel_size))
-
-        result = image.copy()
-        result[:, :, :3] = cv2.morphologyEx(image[:, :, :3], cv2.MORPH_BLACKHAT, kernel)
-        return result
+        return _morphology_rgb(image, cv2.MORPH_BLACKHAT, kernel_size)
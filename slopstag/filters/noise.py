@@ -15,6 +15,9 @@ class AddNoiseFilter(BaseFilter):
     description = "Add random noise to the image"
     category = "noise"
 
+    # Every application draws new noise
+    deterministic = False
+
     @classmethod
     def get_params_schema(cls):
         return [
@@ -37,26 +40,35 @@ class AddNoiseFilter(BaseFilter):
         ]
 
     def apply(self, image: np.ndarray, noise_type: str = "gaussian", amount: int = 20) -> np.ndarray:
-        result = image.copy().astype(np.float32)
-        rgb = result[:, :, :3]
-
         if noise_type == "gaussian":
-            # Gaussian noise
+            # Gaussian noise, generated and added by OpenCV in two passes
             sigma = amount * 2.55  # Scale to 0-255 range
-            noise = np.random.normal(0, sigma, rgb.shape)
-            rgb = rgb + noise
-
-        elif noise_type == "salt_pepper":
-            # Salt and pepper noise
+            noise = np.empty(image.shape, dtype=np.float32)
+            # OpenCV's RNG is per thread and starts from a fixed seed in every
+            # new worker thread; seeding it from NumPy gives fresh noise on
+            # each call and keeps np.random.seed reproducible
+            cv2.setRNGSeed(int(np.random.randint(0, 2**31)))
+            # Alpha gets no noise; the -0.5 offset makes the rounding,
+            # saturating add behave like adding and truncating
+            cv2.randn(noise, (-0.5, -0.5, -0.5, 0), (sigma, sigma, sigma, 0))
+            return cv2.add(image, noise, dtype=cv2.CV_8U)
+
+        if noise_type == "salt_pepper":
+            # Salt and pepper noise, set directly on the uint8 image
             prob = amount / 200.0  # Scale probability
-            # Salt (white)
-            salt = np.random.random(rgb.shape[:2]) < prob
-            rgb[salt] = 255
-            # Pepper (black)
-            pepper = np.random.random(rgb.shape[:2]) < prob
-            rgb[pepper] = 0
-
-        elif noise_type == "poisson":
+            # One 16-bit draw per pixel: below prob is pepper (black), the
+            # next prob * (1 - prob) is salt (white), the same odds as
+            # independent salt and pepper draws with pepper painted last
+            draw = np.random.randint(0, 1 << 16, size=image.shape[:2], dtype=np.uint16)
+            result = image.copy()
+            result[draw < round((2 * prob - prob * prob) * (1 << 16)), :3] = 255
+            result[draw < round(prob * (1 << 16)), :3] = 0
+            return result
+
+        result = image.copy().astype(np.float32)
+        rgb = result[:, :, :3]
+
+        if noise_type == "poisson":
             # Poisson noise
             vals = len(np.unique(rgb))
             vals = 2 ** np.ceil(np.log2(vals))
@@ -120,7 +132,8 @@ class DenoiseFilter(BaseFilter):
         # OpenCV's fast NL means denoising for color images
         denoised = cv2.fastNlMeansDenoisingColored(rgb, None, strength, strength, block_size, search_window)
 
-        result = np.concatenate([denoised, image[:, :, 3:4]], axis=2)
+        result = self._rgba_output_like(image)
+        result[:, :, :3] = denoised
         return result
 
 
@@ -154,7 +167,8 @@ class DenoiseTVFilter(BaseFilter):
         denoised = denoise_tv_chambolle(rgb, weight=weight, channel_axis=2)
         denoised = (denoised * 255).astype(np.uint8)
 
-        result = np.concatenate([denoised, image[:, :, 3:4]], axis=2)
+        result = self._rgba_output_like(image)
+        result[:, :, :3] = denoised
         return result
 
 
@@ -197,7 +211,8 @@ class DenoiseWaveletFilter(BaseFilter):
         denoised = denoise_wavelet(rgb, sigma=sigma_val, wavelet=wavelet, channel_axis=2, rescale_sigma=True)
         denoised = (np.clip(denoised, 0, 1) * 255).astype(np.uint8)
 
-        result = np.concatenate([denoised, image[:, :, 3:4]], axis=2)
+        result = self._rgba_output_like(image)
+        result[:, :, :3] = denoised
         return result
 
 
@@ -240,7 +255,8 @@ class DenoiseBilateralFilter(BaseFilter):
         denoised = denoise_bilateral(rgb, sigma_color=sigma_color, sigma_spatial=sigma_spatial, channel_axis=2)
         denoised = (denoised * 255).astype(np.uint8)
 
-        result = np.concatenate([denoised, image[:, :, 3:4]], axis=2)
+        result = self._rgba_output_like(image)
+        result[:, :, :3] = denoised
         return result
 
 
@@ -267,18 +283,13 @@ class RemoveHotPixelsFilter(BaseFilter):
         ]
 
     def apply(self, image: np.ndarray, threshold: int = 50) -> np.ndarray:
-        from scipy import ndimage
-
-        result = image.copy()
-
-        for c in range(3):
-            channel = image[:, :, c].astype(np.float32)
-            # Get median filtered version
-            median = ndimage.median_filter(channel, size=3)
-            # Find outliers
-            diff = np.abs(channel - median)
-            outliers = diff > threshold
-            # Replace outliers with median
-            result[:, :, c][outliers] = median[outliers]
-
-        return result
+        import cv2
+
+        # Get median filtered version of all channels in one uint8 pass (for
+        # a 3x3 window its replicated border equals scipy's reflect mode)
+        median = cv2.medianBlur(image, 3)
+        # Find outliers in the color channels
+        outliers = cv2.absdiff(image, median) > threshold
+        outliers[:, :, 3] = False
+        # Replace outliers with median
+        return np.where(outliers, median, image)
@@ -56,7 +56,8 @@ class UnsharpMaskFilter(BaseFilter):
 
         # Convert back to uint8
         rgb_uint8 = (rgb_result * 255).astype(np.uint8)
-        alpha_uint8 = image[:, :, 3:4]  # Preserve original alpha for sharpen
 
-        result = np.concatenate([rgb_uint8, alpha_uint8], axis=2)
+        # Preserve original alpha for sharpen
+        result = self._rgba_output_like(image)
+        result[:, :, :3] = rgb_uint8
         return result
@@ -9,11 +9,12 @@ between JS and Python, and verified by pixel diff tests.
 
 from .text import render_text_layer
 from .vector import render_vector_layer
-from .document import render_document, render_layer
+from .document import apply_layer_effects, render_document, render_layer
 
 __all__ = [
     "render_text_layer",
     "render_vector_layer",
     "render_document",
     "render_layer",
+    "apply_layer_effects",
 ]
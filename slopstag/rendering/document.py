@@ -8,12 +8,19 @@ import numpy as np
 from PIL import Image
 from typing import Any, Dict, List, Optional, Tuple
 import base64
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 
+from ..effects import deserialize_effect, effect_render_index
 from .text import render_text_layer
 from .vector import render_vector_layer
 
 
+# Renders the layers of a document concurrently, shared across documents
+# instead of starting new threads for every render
+_LAYER_POOL = ThreadPoolExecutor(thread_name_prefix="layer-render")
+
+
 # Blend mode implementations matching canvas globalCompositeOperation
 BLEND_MODES = {
     "normal": "source-over",
@@ -61,6 +68,7 @@ def blend_layers(
     blend_mode: str = "normal",
     offset_x: int = 0,
     offset_y: int = 0,
+    in_place: bool = False,
 ) -> np.ndarray:
     """Blend source layer onto destination.
 
@@ -71,11 +79,13 @@ def blend_layers(
         blend_mode: Blend mode name
         offset_x: Source X offset in destination
         offset_y: Source Y offset in destination
+        in_place: Write the result into dst instead of a copy
 
     Returns:
         Blended result
     """
-    result = dst.copy().astype(np.float64)
+    # Stay in uint8 and only promote the overlap region to float
+    result = dst if in_place else dst.copy()
     dst_h, dst_w = dst.shape[:2]
     src_h, src_w = src.shape[:2]
 
@@ -86,7 +96,7 @@ def blend_layers(
     y2 = min(dst_h, offset_y + src_h)
 
     if x1 >= x2 or y1 >= y2:
-        return result.astype(np.uint8)
+        return result
 
     # Source region
     sx1 = x1 - offset_x
@@ -94,12 +104,31 @@ def blend_layers(
     sx2 = x2 - offset_x
     sy2 = y2 - offset_y
 
+    # Opaque source at full opacity replaces the destination outright
+    src_alpha_u8 = src[sy1:sy2, sx1:sx2, 3]
+    if opacity == 1.0 and (src_alpha_u8 == 255).all():
+        result[y1:y2, x1:x2] = src[sy1:sy2, sx1:sx2]
+        return result
+
+    dst_opaque = (dst[y1:y2, x1:x2, 3] == 255).all()
+    if dst_opaque and (opacity == 0 or not src_alpha_u8.any()):
+        # Fully transparent source leaves an opaque destination unchanged
+        return result
+
     # Get regions
-    dst_region = result[y1:y2, x1:x2].astype(np.float64)
+    dst_region = dst[y1:y2, x1:x2].astype(np.float64)
     src_region = src[sy1:sy2, sx1:sx2].astype(np.float64)
 
     # Apply opacity
     src_alpha = (src_region[:, :, 3:4] / 255.0) * opacity
+
+    # Fast path for an opaque destination (e.g. over the document background):
+    # out_alpha is exactly 1, so the un-premultiply divide can be skipped
+    if dst_opaque:
+        out_rgb = src_region[:, :, :3] * src_alpha + dst_region[:, :, :3] * (1 - src_alpha)
+        result[y1:y2, x1:x2, :3] = np.clip(out_rgb, 0, 255)
+        return result
+
     dst_alpha = dst_region[:, :, 3:4] / 255.0
 
     # Simple "source-over" compositing for now
@@ -115,17 +144,53 @@ def blend_layers(
         dst_region[:, :, :3] * dst_alpha * (1 - src_alpha)
     ) / out_alpha_safe
 
-    # Combine
+    # Combine (assignment truncates to uint8)
     result[y1:y2, x1:x2, :3] = np.clip(out_rgb, 0, 255)
     result[y1:y2, x1:x2, 3:4] = out_alpha * 255
 
-    return result.astype(np.uint8)
+    return result
+
+
+def apply_layer_effects(
+    pixels: np.ndarray, effects_data: List[Dict[str, Any]]
+) -> Tuple[np.ndarray, int, int]:
+    """Apply a layer's effects, matching EffectRenderer.renderEffects().
+
+    The layer is padded by the largest expansion of all its enabled effects,
+    then the effects are rendered in effect_render_order. Effects without
+    a server-side renderer, or with zero opacity, still pad the layer but
+    are not rendered.
+
+    Returns:
+        (rgba_array, left_expansion, top_expansion)
+    """
+    enabled = [
+        effect
+        for effect in map(deserialize_effect, effects_data)
+        if effect is not None and effect.enabled
+    ]
+    if not enabled:
+        return pixels, 0, 0
+
+    expansions = [effect.get_expansion() for effect in enabled]
+    left, top, right, bottom = (
+        max(expansion[side] for expansion in expansions)
+        for side in ("left", "top", "right", "bottom")
+    )
+    if left or top or right or bottom:
+        pixels = np.pad(pixels, ((top, bottom), (left, right), (0, 0)))
+
+    effects = [effect for effect in enabled if effect.opacity > 0 and hasattr(effect, "render")]
+    for effect in sorted(effects, key=lambda effect: effect_render_index[effect.type]):
+        pixels = effect.render(pixels)
+
+    return pixels, left, top
 
 
 def render_layer(
     layer_data: Dict[str, Any],
 ) -> Tuple[np.ndarray, int, int]:
-    """Render a single layer to RGBA array.
+    """Render a single layer to RGBA array, including its layer effects.
 
     Args:
         layer_data: Serialized layer data
@@ -140,12 +205,10 @@ def render_layer(
     if layer_type == "text":
         # Render text layer
         pixels = render_text_layer(layer_data)
-        return pixels, offset_x, offset_y
 
     elif layer_type == "vector":
         # Render vector layer
         pixels = render_vector_layer(layer_data)
-        return pixels, offset_x, offset_y
 
     else:
         # Raster layer - decode PNG
@@ -157,7 +220,8 @@ def render_layer(
             height = layer_data.get("height", 100)
             pixels = np.zeros((height, width, 4), dtype=np.uint8)
 
-        return pixels, offset_x, offset_y
+    pixels, left, top = apply_layer_effects(pixels, layer_data.get("effects", []))
+    return pixels, offset_x - left, offset_y - top
 
 
 def render_document(
@@ -185,25 +249,33 @@ def render_document(
     canvas = np.zeros((height, width, 4), dtype=np.uint8)
     canvas[:, :] = background_color
 
-    # Composite layers from bottom to top
-    for layer_data in layers:
-        if not layer_data.get("visible", True):
-            continue
+    # Skip hidden and fully transparent layers before decoding any pixels
+    visible_layers = [
+        layer_data
+        for layer_data in layers
+        if layer_data.get("visible", True) and layer_data.get("opacity", 1.0) > 0
+    ]
+
+    # Render layers concurrently; PNG decoding and rasterization release the GIL
+    if len(visible_layers) > 1:
+        rendered = list(_LAYER_POOL.map(render_layer, visible_layers))
+    else:
+        rendered = [render_layer(layer_data) for layer_data in visible_layers]
 
+    # Composite layers from bottom to top
+    for layer_data, (layer_pixels, offset_x, offset_y) in zip(visible_layers, rendered):
         opacity = layer_data.get("opacity", 1.0)
         blend_mode = layer_data.get("blendMode", "normal")
 
-        # Render the layer
-        layer_pixels, offset_x, offset_y = render_layer(layer_data)
-
         # Blend onto canvas
-        canvas = blend_layers(
+        blend_layers(
             canvas,
             layer_pixels,
             opacity=opacity,
             blend_mode=blend_mode,
             offset_x=offset_x,
             offset_y=offset_y,
+            in_place=True,
         )
 
     return canvas
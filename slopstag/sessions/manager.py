@@ -7,6 +7,20 @@ from typing import Any
 from .models import EditorSession, LayerInfo, SessionState
 
 
+def _editor_error(error: str) -> dict[str, Any]:
+    """Build error metadata for an error reported by the editor.
+
+    The editor reports missing layers, effects and tools with messages
+    containing "not found" (e.g. "Layer not found: abc"), which map to 404.
+    """
+    return {"error": error, "code": 404 if "not found" in error.lower() else 500}
+
+
+def _editor_failure(error: str) -> dict[str, Any]:
+    """Build a failure result for an error reported by the editor."""
+    return {"success": False, **_editor_error(error)}
+
+
 class SessionManager:
     """Manages all active editor sessions."""
 
@@ -14,6 +28,8 @@ class SessionManager:
         self._sessions: dict[str, EditorSession] = {}
         self._cleanup_task: asyncio.Task | None = None
         self._session_timeout = timedelta(minutes=5)
+        # In-flight image fetches, shared by concurrent requests for the same image
+        self._pending_images: dict[tuple[str, str | None], asyncio.Future] = {}
 
     def register(
         self,
@@ -112,7 +128,7 @@ class SessionManager:
         """Execute a tool action on a session."""
         session = self._sessions.get(session_id)
         if not session:
-            return {"success": False, "error": "Session not found"}
+            return {"success": False, "error": "Session not found", "code": 404}
 
         if not session.editor:
             return {"success": False, "error": "Editor not connected"}
@@ -129,7 +145,7 @@ class SessionManager:
             )
             return {"success": True, "result": result}
         except Exception as e:
-            return {"success": False, "error": str(e)}
+            return _editor_failure(str(e))
 
     async def execute_command(
         self,
@@ -140,7 +156,7 @@ class SessionManager:
         """Execute an editor command on a session."""
         session = self._sessions.get(session_id)
         if not session:
-            return {"success": False, "error": "Session not found"}
+            return {"success": False, "error": "Session not found", "code": 404}
 
         if not session.editor:
             return {"success": False, "error": "Editor not connected"}
@@ -155,7 +171,7 @@ class SessionManager:
             )
             return {"success": True, "result": result}
         except Exception as e:
-            return {"success": False, "error": str(e)}
+            return _editor_failure(str(e))
 
     async def get_image(
         self,
@@ -168,13 +184,31 @@ class SessionManager:
         """
         session = self._sessions.get(session_id)
         if not session:
-            return None, {"error": "Session not found"}
+            return None, {"error": "Session not found", "code": 404}
 
         if not session.editor:
             return None, {"error": "Editor not connected"}
 
         session.update_activity()
 
+        # Concurrent polling clients share a single composite round trip
+        key = (session_id, layer_id)
+        pending = self._pending_images.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._fetch_image(session, layer_id))
+            self._pending_images[key] = pending
+            pending.add_done_callback(lambda _: self._pending_images.pop(key, None))
+
+        # Shielded so a disconnecting client does not cancel the shared fetch
+        rgba_bytes, metadata = await asyncio.shield(pending)
+        return rgba_bytes, dict(metadata)
+
+    async def _fetch_image(
+        self,
+        session: EditorSession,
+        layer_id: str | None,
+    ) -> tuple[bytes | None, dict[str, Any]]:
+        """Request image data from the session's editor."""
         try:
             # Request image data from JavaScript
             result = await session.editor.run_method(
@@ -195,9 +229,11 @@ class SessionManager:
                     metadata["layer_opacity"] = result.get("opacity", 1.0)
                     metadata["layer_blend_mode"] = result.get("blend_mode", "normal")
                 return rgba_bytes, metadata
+            if result and "error" in result:
+                return None, _editor_error(result["error"])
             return None, {"error": "No image data returned"}
         except Exception as e:
-            return None, {"error": str(e)}
+            return None, _editor_error(str(e))
 
     async def export_document(
         self,
@@ -209,7 +245,7 @@ class SessionManager:
         """
         session = self._sessions.get(session_id)
         if not session:
-            return None, {"error": "Session not found"}
+            return None, {"error": "Session not found", "code": 404}
 
         if not session.editor:
             return None, {"error": "Editor not connected"}
@@ -223,7 +259,7 @@ class SessionManager:
                 return result["document"], {"success": True}
             return None, {"error": "No document data returned"}
         except Exception as e:
-            return None, {"error": str(e)}
+            return None, _editor_error(str(e))
 
     async def import_document(
         self,
@@ -236,7 +272,7 @@ class SessionManager:
         """
         session = self._sessions.get(session_id)
         if not session:
-            return {"success": False, "error": "Session not found"}
+            return {"success": False, "error": "Session not found", "code": 404}
 
         if not session.editor:
             return {"success": False, "error": "Editor not connected"}
@@ -251,7 +287,7 @@ class SessionManager:
             )
             return {"success": True, "result": result}
         except Exception as e:
-            return {"success": False, "error": str(e)}
+            return _editor_failure(str(e))
 
     async def get_config(
         self,
@@ -269,7 +305,7 @@ class SessionManager:
         """
         session = self._sessions.get(session_id)
         if not session:
-            return None, {"error": "Session not found"}
+            return None, {"error": "Session not found", "code": 404}
 
         if not session.editor:
             return None, {"error": "Editor not connected"}
@@ -280,7 +316,7 @@ class SessionManager:
             result = await session.editor.run_method("getConfig", path)
             return result, {"success": True}
         except Exception as e:
-            return None, {"error": str(e)}
+            return None, _editor_error(str(e))
 
     async def set_config(
         self,
@@ -299,7 +335,7 @@ class SessionManager:
         """
         session = self._sessions.get(session_id)
         if not session:
-            return {"success": False, "error": "Session not found"}
+            return {"success": False, "error": "Session not found", "code": 404}
 
         if not session.editor:
             return {"success": False, "error": "Editor not connected"}
@@ -310,7 +346,7 @@ class SessionManager:
             result = await session.editor.run_method("setConfig", path, value)
             return {"success": True, "result": result}
         except Exception as e:
-            return {"success": False, "error": str(e)}
+            return _editor_failure(str(e))
 
     def cleanup_inactive(self) -> None:
         """Remove sessions that have been inactive too long."""
@@ -337,7 +373,7 @@ class SessionManager:
         """
         session = self._sessions.get(session_id)
         if not session:
-            return None, {"error": "Session not found"}
+            return None, {"error": "Session not found", "code": 404}
 
         if not session.editor:
             return None, {"error": "Editor not connected"}
@@ -353,7 +389,7 @@ class SessionManager:
                 return result, {"success": True}
             return None, {"error": "No effects data returned"}
         except Exception as e:
-            return None, {"error": str(e)}
+            return None, _editor_error(str(e))
 
     async def add_layer_effect(
         self,
@@ -368,7 +404,7 @@ class SessionManager:
         """
         session = self._sessions.get(session_id)
         if not session:
-            return {"success": False, "error": "Session not found"}
+            return {"success": False, "error": "Session not found", "code": 404}
 
         if not session.editor:
             return {"success": False, "error": "Editor not connected"}
@@ -384,9 +420,9 @@ class SessionManager:
             )
             if result and result.get("success"):
                 return result
-            return {"success": False, "error": result.get("error", "Failed to add effect")}
+            return _editor_failure(result.get("error", "Failed to add effect"))
         except Exception as e:
-            return {"success": False, "error": str(e)}
+            return _editor_failure(str(e))
 
     async def update_layer_effect(
         self,
@@ -401,7 +437,7 @@ class SessionManager:
         """
         session = self._sessions.get(session_id)
         if not session:
-            return {"success": False, "error": "Session not found"}
+            return {"success": False, "error": "Session not found", "code": 404}
 
         if not session.editor:
             return {"success": False, "error": "Editor not connected"}
@@ -417,9 +453,9 @@ class SessionManager:
             )
             if result and result.get("success"):
                 return result
-            return {"success": False, "error": result.get("error", "Failed to update effect")}
+            return _editor_failure(result.get("error", "Failed to update effect"))
         except Exception as e:
-            return {"success": False, "error": str(e)}
+            return _editor_failure(str(e))
 
     async def remove_layer_effect(
         self,
@@ -433,7 +469,7 @@ class SessionManager:
         """
         session = self._sessions.get(session_id)
         if not session:
-            return {"success": False, "error": "Session not found"}
+            return {"success": False, "error": "Session not found", "code": 404}
 
         if not session.editor:
             return {"success": False, "error": "Editor not connected"}
@@ -448,9 +484,9 @@ class SessionManager:
             )
             if result and result.get("success"):
                 return result
-            return {"success": False, "error": result.get("error", "Failed to remove effect")}
+            return _editor_failure(result.get("error", "Failed to remove effect"))
         except Exception as e:
-            return {"success": False, "error": str(e)}
+            return _editor_failure(str(e))
 
 
 # Global singleton instance
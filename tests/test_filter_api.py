@@ -0,0 +1,187 @@
+"""Filter API tests against the FastAPI app, without a browser or server."""
+
+import hashlib
+import warnings
+
+import numpy as np
+import orjson
+import pytest
+from fastapi.exceptions import FastAPIDeprecationWarning
+from fastapi.testclient import TestClient
+
+from slopstag.api import filters as filters_api
+from slopstag.app import create_api_app
+
+
+@pytest.fixture(scope="module")
+def client() -> TestClient:
+    """In-process client for the API application."""
+    return TestClient(create_api_app())
+
+
+def filter_body(image: np.ndarray, params: dict | None = None, **metadata) -> bytes:
+    """Encode a filter request: metadata length, JSON metadata, raw RGBA."""
+    header = {"width": image.shape[1], "height": image.shape[0], "params": params or {}}
+    header.update(metadata)
+    encoded = orjson.dumps(header)
+    return len(encoded).to_bytes(4, "little") + encoded + image.tobytes()
+
+
+def get_without_deprecation(client: TestClient, url: str):
+    """GET a URL, failing if FastAPI reports a deprecated feature."""
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        response = client.get(url)
+    assert not [w for w in caught if issubclass(w.category, FastAPIDeprecationWarning)]
+    return response
+
+
+def sample_image(height: int = 16, width: int = 24, seed: int = 0) -> np.ndarray:
+    """Random RGBA test image."""
+    return np.random.default_rng(seed).integers(0, 256, (height, width, 4), dtype=np.uint8)
+
+
+class TestFilterListing:
+    """Tests for the JSON filter listing endpoints."""
+
+    def test_list_filters(self, client: TestClient):
+        """Filters are listed with their parameter schemas."""
+        response = get_without_deprecation(client, "/filters")
+        assert response.status_code == 200
+        filters = {entry["id"]: entry for entry in response.json()["filters"]}
+        assert "invert" in filters
+        assert isinstance(filters["add_noise"]["params"], list)
+
+    def test_all_previews(self, client: TestClient):
+        """All previews are returned as PNG data URLs."""
+        response = get_without_deprecation(client, "/filters/previews/all")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        previews = response.json()["previews"]
+        assert previews["invert"].startswith("data:image/png;base64,")
+
+
+    def test_all_previews_body_is_reused(self, client: TestClient, monkeypatch):
+        """The combined response is built once and rebuilt after new previews."""
+        monkeypatch.setattr(filters_api, "_preview_cache", dict(filters_api._preview_cache))
+        monkeypatch.setattr(filters_api, "_all_previews_body", None)
+
+        first = client.get("/filters/previews/all")
+        body = filters_api._all_previews_body
+        assert body is not None
+        assert client.get("/filters/previews/all").content == first.content
+        assert filters_api._all_previews_body is body
+
+        filters_api._store_previews({"invert": b"new preview"})
+        assert filters_api._all_previews_body is None
+        previews = client.get("/filters/previews/all").json()["previews"]
+        assert previews["invert"] == "data:image/png;base64,bmV3IHByZXZpZXc="
+
+
+class TestFilterPreview:
+    """Tests for the filter preview endpoint."""
+
+    def test_preview_is_revalidated(self, client: TestClient):
+        """Previews must be revalidated since their URL is not versioned."""
+        response = client.get("/filters/grayscale/preview")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/png"
+        assert response.headers["cache-control"] == "no-cache"
+        assert "immutable" not in response.headers["cache-control"]
+
+        etag = response.headers["etag"]
+        cached = client.get("/filters/grayscale/preview", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.headers["etag"] == etag
+        assert cached.content == b""
+
+    def test_preview_unknown_filter(self, client: TestClient):
+        """Unknown filters have no preview."""
+        assert client.get("/filters/no_such_filter/preview").status_code == 404
+
+
+class TestApplyFilter:
+    """Tests for applying filters to raw RGBA data."""
+
+    def test_apply_returns_rgba(self, client: TestClient):
+        """The response is the filtered image as raw RGBA bytes with an ETag."""
+        image = sample_image()
+        response = client.post("/filters/invert", content=filter_body(image))
+        assert response.status_code == 200
+        assert "etag" in response.headers
+
+        result = np.frombuffer(response.content, dtype=np.uint8).reshape(image.shape)
+        np.testing.assert_array_equal(result[:, :, :3], 255 - image[:, :, :3])
+        np.testing.assert_array_equal(result[:, :, 3], image[:, :, 3])
+
+    def test_cached_etag_returns_no_content(self, client: TestClient):
+        """A client holding the result gets 204 instead of the pixels again."""
+        body = filter_body(sample_image(seed=1))
+        etag = client.post("/filters/invert", content=body).headers["etag"]
+
+        response = client.post("/filters/invert", content=body, headers={"X-Cached-ETag": etag})
+        assert response.status_code == 204
+        assert response.headers["etag"] == etag
+        assert response.content == b""
+
+    def test_if_none_match_is_ignored_for_post(self, client: TestClient):
+        """POST never answers 304; If-None-Match still returns the full result."""
+        image = sample_image(seed=2)
+        body = filter_body(image)
+        etag = client.post("/filters/invert", content=body).headers["etag"]
+
+        response = client.post("/filters/invert", content=body, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert len(response.content) == image.nbytes
+
+    def test_random_filter_is_not_cached(self, client: TestClient):
+        """Identical noise requests draw new noise and are never answered with 204."""
+        image = np.full((16, 24, 4), 128, dtype=np.uint8)
+        body = filter_body(image, {"noise_type": "gaussian", "amount": 20})
+
+        # The ETag a deterministic filter would have had for this request
+        etag = f'"{hashlib.blake2b(b"add_noise" + body, digest_size=8).hexdigest()}"'
+
+        first = client.post("/filters/add_noise", content=body)
+        second = client.post("/filters/add_noise", content=body, headers={"X-Cached-ETag": etag})
+        assert first.status_code == second.status_code == 200
+        assert "etag" not in first.headers
+        assert first.content != second.content
+        assert not any(key[0] == "add_noise" for key in filters_api._result_cache)
+
+    @pytest.mark.parametrize(
+        "width, height",
+        [(-4, -4), (0, 16), (24.0, 16), ("24", 16), (True, 16), (24, None)],
+    )
+    def test_invalid_dimensions(self, client: TestClient, width, height):
+        """Width and height must be positive integers."""
+        body = filter_body(sample_image(), width=width, height=height)
+        response = client.post("/filters/invert", content=body)
+        assert response.status_code == 400
+
+    def test_result_cache_is_bounded_by_bytes(self, client: TestClient, monkeypatch):
+        """Old results are evicted once their total size exceeds the budget."""
+        image = sample_image(seed=3)
+        monkeypatch.setattr(filters_api, "_RESULT_CACHE_MAX_BYTES", 2 * image.nbytes)
+        monkeypatch.setattr(filters_api, "_result_cache", type(filters_api._result_cache)())
+        monkeypatch.setattr(filters_api, "_result_cache_bytes", 0)
+
+        for seed in range(4):
+            body = filter_body(sample_image(seed=10 + seed))
+            assert client.post("/filters/invert", content=body).status_code == 200
+
+        assert len(filters_api._result_cache) == 2
+        assert filters_api._result_cache_bytes == 2 * image.nbytes
+
+    def test_result_cache_counts_repeated_keys_once(self, monkeypatch):
+        """Storing a result twice under one key does not inflate the byte count."""
+        monkeypatch.setattr(filters_api, "_RESULT_CACHE_MAX_BYTES", 100)
+        monkeypatch.setattr(filters_api, "_result_cache", type(filters_api._result_cache)())
+        monkeypatch.setattr(filters_api, "_result_cache_bytes", 0)
+
+        for key in ("a", "b"):
+            for _ in range(2):
+                filters_api._cache_result(("invert", key), memoryview(bytes(40)))
+
+        assert list(filters_api._result_cache) == [("invert", "a"), ("invert", "b")]
+        assert filters_api._result_cache_bytes == 80
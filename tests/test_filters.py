@@ -0,0 +1,205 @@
+"""Tests for the fast paths of the image filters against reference implementations."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2
+import numpy as np
+import pytest
+from scipy import ndimage
+from skimage import data
+
+from slopstag.filters.blur import (
+    _gaussian_iir,
+    _guided_filter,
+    _median_blur_premultiplied_u8,
+    _motion_kernel,
+    _separable_motion_kernel,
+)
+from slopstag.filters.morphology import _morphology_rgb, _octagon_morphology
+from slopstag.filters.noise import AddNoiseFilter
+
+
+def random_rgba(height: int = 40, width: int = 50, seed: int = 0) -> np.ndarray:
+    """Random opaque RGBA test image."""
+    image = np.random.default_rng(seed).integers(0, 256, (height, width, 4), dtype=np.uint8)
+    image[:, :, 3] = 255
+    return image
+
+
+class TestGaussianIIR:
+    """Test the recursive Gaussian used for large sigmas."""
+
+    def test_matches_gaussian_filter(self):
+        """A sigma=18 blur stays within a few levels of the exact Gaussian."""
+        image = data.astronaut().astype(np.float32)
+        result = _gaussian_iir(image, 18.0)
+        expected = ndimage.gaussian_filter(image, sigma=(18, 18, 0), mode="nearest")
+
+        assert result.shape == image.shape
+        assert np.abs(result - expected).max() < 3.0
+        assert np.abs(result - expected).mean() < 1.0
+
+    def test_preserves_constant_image(self):
+        """Replicated borders keep a flat image flat to well within rounding."""
+        image = np.full((30, 40, 4), 100.0, dtype=np.float32)
+        np.testing.assert_allclose(_gaussian_iir(image, 18.0), image, atol=0.5)
+
+
+class TestMedianBlurPremultipliedU8:
+    """Test the 8-bit median used for large windows."""
+
+    def test_matches_median_filter_on_opaque_image(self):
+        """Opaque pixels get the exact per-channel median."""
+        image = random_rgba()
+        result = _median_blur_premultiplied_u8(image, 7)
+        expected = np.stack(
+            [ndimage.median_filter(image[:, :, c], size=7, mode="constant") for c in range(4)],
+            axis=-1,
+        )
+
+        # Away from the zero-padded border alpha stays opaque
+        np.testing.assert_array_equal(result[3:-3, 3:-3], expected[3:-3, 3:-3])
+
+    def test_keeps_color_of_translucent_region(self):
+        """Un-premultiplying restores the color of a flat translucent area."""
+        image = np.zeros((30, 30, 4), dtype=np.uint8)
+        image[:, :] = [200, 100, 50, 128]
+        result = _median_blur_premultiplied_u8(image, 9)
+
+        interior = result[4:-4, 4:-4].reshape(-1, 4).astype(int)
+        assert (interior[:, 3] == 128).all()
+        assert np.abs(interior[:, :3] - [200, 100, 50]).max() <= 2
+
+
+class TestGuidedFilter:
+    """Test the self-guided filter used for large bilateral sigmas."""
+
+    def test_matches_reference(self):
+        """Matches a float64 guided filter built from uniform filters."""
+        image = data.astronaut()
+        radius, eps = 8, 0.01
+        result = _guided_filter(image, radius, eps)
+
+        size = (2 * radius + 1, 2 * radius + 1, 1)
+
+        def box(arr):
+            return ndimage.uniform_filter(arr, size=size, mode="reflect")
+
+        guide = image / 255.0
+        mean = box(guide)
+        a = (box(guide * guide) - mean * mean) / (box(guide * guide) - mean * mean + eps)
+        b = mean - a * mean
+        expected = np.clip((box(a) * guide + box(b)) * 255 + 0.5, 0, 255).astype(np.uint8)
+
+        assert result.dtype == np.uint8
+        assert np.abs(result.astype(int) - expected).max() <= 1
+
+    def test_preserves_strong_edge(self):
+        """A step much stronger than sqrt(eps) is kept sharp."""
+        image = np.zeros((40, 40, 3), dtype=np.uint8)
+        image[:, 20:] = 255
+        result = _guided_filter(image, 5, 0.001)
+
+        assert result[:, :18].max() <= 5
+        assert result[:, 22:].min() >= 250
+
+
+class TestSeparableMotionKernel:
+    """Test splitting axis-aligned motion kernels into 1-D passes."""
+
+    @pytest.mark.parametrize("size", [15, 16])
+    @pytest.mark.parametrize("angle", [0, 90, 180, 270])
+    def test_matches_2d_kernel(self, size: int, angle: int):
+        """Where a split exists, two 1-D passes equal the 2-D filter."""
+        parts = _separable_motion_kernel(size, angle)
+        if parts is None:
+            pytest.skip("kernel is not axis-aligned for this size")
+
+        image = np.random.default_rng(0).random((30, 40)).astype(np.float32)
+        separable = cv2.sepFilter2D(image, -1, *parts)
+        full = cv2.filter2D(image, -1, _motion_kernel(size, angle))
+        np.testing.assert_allclose(separable, full, atol=1e-5)
+
+    def test_horizontal_and_vertical_split(self):
+        """Horizontal and vertical lines are always separable."""
+        assert _separable_motion_kernel(15, 0) is not None
+        assert _separable_motion_kernel(15, 90) is not None
+
+    def test_other_kernels_are_not_split(self):
+        """Diagonal and tiny kernels keep the 2-D filter."""
+        assert _separable_motion_kernel(15, 45) is None
+        assert _separable_motion_kernel(3, 0) is None
+
+    def test_parts_are_read_only(self):
+        """Cached parts cannot be modified by callers."""
+        kernel_x, kernel_y = _separable_motion_kernel(15, 0)
+        assert not kernel_x.flags.writeable
+        assert not kernel_y.flags.writeable
+
+
+class TestOctagonMorphology:
+    """Test the octagon approximation of large elliptical kernels."""
+
+    @pytest.mark.parametrize("radius", [10, 20])
+    def test_dilation_approximates_disc(self, radius: int):
+        """Dilating a dot gives an octagon of the right radius close to the disc."""
+        dot = np.zeros((61, 61), dtype=np.uint8)
+        dot[30, 30] = 255
+        octagon = _octagon_morphology(dot, cv2.MORPH_DILATE, radius) > 0
+        disc_kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (2 * radius + 1, 2 * radius + 1))
+        disc = cv2.dilate(dot, disc_kernel) > 0
+
+        ys, xs = np.nonzero(octagon)
+        assert (xs.min(), xs.max()) == (30 - radius, 30 + radius)
+        assert (ys.min(), ys.max()) == (30 - radius, 30 + radius)
+        assert (octagon & disc).sum() / (octagon | disc).sum() > 0.9
+
+    def test_erosion_is_dual_of_dilation(self):
+        """Eroding an image equals inverting the dilation of its inverse."""
+        image = random_rgba()
+        eroded = _octagon_morphology(image, cv2.MORPH_ERODE, 10)
+        dilated = _octagon_morphology(255 - image, cv2.MORPH_DILATE, 10)
+        np.testing.assert_array_equal(eroded, 255 - dilated)
+
+    def test_morphology_rgb_uses_octagon_for_large_ellipses(self):
+        """Large elliptical kernels go through the octagon and keep alpha."""
+        image = random_rgba()
+        image[:, :, 3] = np.arange(image.shape[1], dtype=np.uint8)
+        result = _morphology_rgb(image, cv2.MORPH_DILATE, 21, shape="ellipse")
+
+        expected = _octagon_morphology(image, cv2.MORPH_DILATE, 10)
+        np.testing.assert_array_equal(result[:, :, :3], expected[:, :, :3])
+        np.testing.assert_array_equal(result[:, :, 3], image[:, :, 3])
+
+
+class TestGaussianNoise:
+    """Test the randomness of the OpenCV Gaussian noise path."""
+
+    def _noisy(self):
+        image = np.full((32, 32, 4), 128, dtype=np.uint8)
+        return AddNoiseFilter().apply(image, noise_type="gaussian", amount=20)
+
+    def test_calls_differ(self):
+        """Consecutive calls draw different noise."""
+        assert not np.array_equal(self._noisy(), self._noisy())
+
+    def test_fresh_threads_differ(self):
+        """The first call on each new worker thread draws different noise."""
+        results = []
+        for _ in range(2):
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                results.append(executor.submit(self._noisy).result())
+        assert not np.array_equal(*results)
+
+    def test_seeded_calls_are_reproducible(self):
+        """np.random.seed makes the noise reproducible."""
+        np.random.seed(1234)
+        first = self._noisy()
+        np.random.seed(1234)
+        assert np.array_equal(first, self._noisy())
+
+    def test_alpha_is_unchanged(self):
+        """Only the color channels get noise."""
+        noisy = self._noisy()
+        assert (noisy[:, :, 3] == 128).all()
+        assert 0 < noisy[:, :, :3].std() < 128
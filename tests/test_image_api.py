@@ -0,0 +1,46 @@
+"""Image source API tests against the FastAPI app, without a browser or server."""
+
+import numpy as np
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+from skimage import data
+
+from slopstag.app import create_api_app
+
+
+@pytest.fixture(scope="module")
+def client() -> TestClient:
+    """In-process client for the API application."""
+    return TestClient(create_api_app())
+
+
+def decode_image_payload(payload: bytes) -> tuple[dict, np.ndarray]:
+    """Split a get_image payload into its metadata and RGBA pixels."""
+    metadata_length = int.from_bytes(payload[:4], "little")
+    metadata = orjson.loads(payload[4 : 4 + metadata_length])
+    pixels = np.frombuffer(payload, dtype=np.uint8, offset=4 + metadata_length)
+    return metadata, pixels.reshape((metadata["height"], metadata["width"], 4))
+
+
+class TestGetImage:
+    """Tests for fetching sample images as raw RGBA."""
+
+    @pytest.mark.parametrize("image_id", ["camera", "astronaut"])
+    def test_image_is_rgba(self, client: TestClient, image_id: str):
+        """Grayscale and RGB images are expanded to opaque RGBA."""
+        source = getattr(data, image_id)()
+        response = client.get(f"/images/skimage/{image_id}")
+        assert response.status_code == 200
+
+        metadata, rgba = decode_image_payload(response.content)
+        assert (metadata["height"], metadata["width"]) == source.shape[:2]
+        if source.ndim == 2:
+            source = source[..., np.newaxis]
+        np.testing.assert_array_equal(rgba[..., :3], np.broadcast_to(source, rgba[..., :3].shape))
+        assert (rgba[..., 3] == 255).all()
+
+    def test_unknown_image(self, client: TestClient):
+        """Unknown sources and images are 404."""
+        assert client.get("/images/no_such_source/camera").status_code == 404
+        assert client.get("/images/skimage/no_such_image").status_code == 404
@@ -0,0 +1,52 @@
+"""Rendering API tests against the FastAPI app, without a browser or server."""
+
+import struct
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from slopstag.app import create_api_app
+
+
+@pytest.fixture(scope="module")
+def client() -> TestClient:
+    """In-process client for the API application."""
+    return TestClient(create_api_app())
+
+
+def diff_binary_body(image1: np.ndarray, image2: np.ndarray, tolerance: float) -> bytes:
+    """Encode a /diff-binary request: <IIf header followed by both images."""
+    height, width = image1.shape[:2]
+    return struct.pack("<IIf", width, height, tolerance) + image1.tobytes() + image2.tobytes()
+
+
+class TestPixelDiffBinary:
+    """Tests for the binary pixel diff endpoint."""
+
+    def test_header_layout(self, client: TestClient):
+        """Width, height and tolerance are little-endian uint32, uint32, float32."""
+        image1 = np.zeros((3, 5, 4), dtype=np.uint8)
+        image2 = image1.copy()
+        image2[0, 0] = 255
+
+        response = client.post("/rendering/diff-binary", content=diff_binary_body(image1, image2, 0.25))
+        assert response.status_code == 200
+        result = response.json()
+        assert result["tolerance"] == 0.25
+        assert result["diff_ratio"] == pytest.approx(1 / 15)
+        assert result["match"] is True
+
+    def test_identical_images_match(self, client: TestClient):
+        """Identical images have no difference even with zero tolerance."""
+        image = np.random.default_rng(0).integers(0, 256, (8, 6, 4), dtype=np.uint8)
+        response = client.post("/rendering/diff-binary", content=diff_binary_body(image, image, 0.0))
+        assert response.status_code == 200
+        assert response.json() == {"diff_ratio": 0.0, "match": True, "tolerance": 0.0}
+
+    def test_size_mismatch(self, client: TestClient):
+        """Body length must match the dimensions in the header."""
+        image = np.zeros((4, 4, 4), dtype=np.uint8)
+        body = diff_binary_body(image, image, 0.0)
+        assert client.post("/rendering/diff-binary", content=body[:-1]).status_code == 400
+        assert client.post("/rendering/diff-binary", content=body[:8]).status_code == 400
@@ -25,6 +25,7 @@ from slopstag.rendering.document import (
     decode_png_data_url,
 )
 from slopstag.rendering.lanczos import lanczos_resample
+from slopstag.effects import BevelEmbossEffect, DropShadowEffect, OuterGlowEffect, StrokeEffect
 
 
 class TestLanczosResampling:
@@ -428,5 +429,116 @@ class TestPixelDiff:
             compute_pixel_diff(img1, img2)
 
 
+class TestBevelEmbossRendering:
+    """Test server-side bevel & emboss rendering."""
+
+    def _square(self):
+        img = np.zeros((100, 100, 4), dtype=np.uint8)
+        img[25:75, 25:75] = [128, 128, 128, 255]
+        return img
+
+    def test_inner_bevel_lights_and_shades_edges(self):
+        """Edges facing the light get brighter, opposite edges darker."""
+        img = self._square()
+        result = BevelEmbossEffect(angle=135, size=4).render(img)
+
+        assert result.shape == img.shape
+        assert result[27, 27, 0] > 128, "Top-left edge should be highlighted"
+        assert result[72, 72, 0] < 128, "Bottom-right edge should be shaded"
+        assert np.array_equal(result[50, 50], img[50, 50]), "Interior unchanged"
+        assert np.array_equal(result[..., 3], img[..., 3]), "Inner bevel keeps alpha"
+
+    def test_soften_spreads_highlight(self):
+        """Soften should blur the highlight further into the interior."""
+        img = self._square()
+        hard = BevelEmbossEffect(angle=135, size=3).render(img)
+        soft = BevelEmbossEffect(angle=135, size=3, soften=3).render(img)
+
+        assert soft[31, 31, 0] > hard[31, 31, 0]
+
+    def _raster_layer(self, img, effects):
+        buffer = BytesIO()
+        Image.fromarray(img).save(buffer, format="PNG")
+        png_base64 = base64.b64encode(buffer.getvalue()).decode()
+        return {
+            "type": "raster",
+            "offsetX": 10,
+            "offsetY": 20,
+            "imageData": f"data:image/png;base64,{png_base64}",
+            "effects": effects,
+        }
+
+    def test_render_layer_applies_bevel(self):
+        """Server-side layer rendering includes the bevel effect."""
+        img = self._square()
+        effect = BevelEmbossEffect(angle=135, size=4)
+        pixels, offset_x, offset_y = render_layer(self._raster_layer(img, [effect.to_dict()]))
+
+        assert (offset_x, offset_y) == (10, 20)
+        assert np.array_equal(pixels, effect.render(img))
+
+    def test_render_layer_expands_outer_bevel(self):
+        """Outer bevels pad the layer and move its offset by the expansion."""
+        img = self._square()
+        effect = BevelEmbossEffect(style="outerBevel", angle=135, size=4)
+        pixels, offset_x, offset_y = render_layer(self._raster_layer(img, [effect.to_dict()]))
+
+        assert pixels.shape == (108, 108, 4)
+        assert (offset_x, offset_y) == (6, 16)
+        assert np.array_equal(pixels, effect.render(np.pad(img, ((4, 4), (4, 4), (0, 0)))))
+
+    def test_render_layer_skips_disabled_effects(self):
+        """Disabled and fully transparent effects leave the layer unchanged."""
+        img = self._square()
+        effects = [
+            BevelEmbossEffect(enabled=False).to_dict(),
+            BevelEmbossEffect(opacity=0.0).to_dict(),
+        ]
+        pixels, _, _ = render_layer(self._raster_layer(img, effects))
+
+        assert np.array_equal(pixels, img)
+
+    def test_render_layer_pads_for_all_enabled_effects(self):
+        """Like the JS renderer, effects without a Python renderer still pad the layer."""
+        img = self._square()
+        shadow = DropShadowEffect(offset_x=4, offset_y=6, blur=2, spread=0)
+        bevel = BevelEmbossEffect(angle=135, size=4)
+        pixels, offset_x, offset_y = render_layer(
+            self._raster_layer(img, [shadow.to_dict(), bevel.to_dict()])
+        )
+
+        # JS expansion: left/top = max(0, 6 - offset), right/bottom = 6 + offset
+        assert shadow.get_expansion() == {"left": 2, "top": 0, "right": 10, "bottom": 12}
+        assert pixels.shape == (112, 112, 4)
+        assert (offset_x, offset_y) == (8, 20)
+        padded = np.pad(img, ((0, 12), (2, 10), (0, 0)))
+        assert np.array_equal(pixels, bevel.render(padded))
+
+    def test_expansion_rounds_up_like_js(self):
+        """Expansions use Math.ceil like the JS effects."""
+        assert DropShadowEffect(offset_x=0, offset_y=0, blur=2.5).get_expansion()["left"] == 8
+        assert OuterGlowEffect(blur=2.5, spread=0).get_expansion()["left"] == 8
+        assert StrokeEffect(position="center", size=4).get_expansion()["left"] == 2
+        assert StrokeEffect(position="center", size=3).get_expansion()["left"] == 2
+        assert BevelEmbossEffect(style="outerBevel", size=2.5).get_expansion()["left"] == 3
+
+    def test_zero_opacity_effect_still_pads(self):
+        """A fully transparent outer bevel is not drawn but still expands the layer."""
+        img = self._square()
+        effect = BevelEmbossEffect(style="outerBevel", size=4, opacity=0.0)
+        pixels, offset_x, offset_y = render_layer(self._raster_layer(img, [effect.to_dict()]))
+
+        assert (offset_x, offset_y) == (6, 16)
+        assert np.array_equal(pixels, np.pad(img, ((4, 4), (4, 4), (0, 0))))
+
+    def test_effect_opacity_scales_bevel(self):
+        """Effect opacity scales the highlight like the canvas globalAlpha."""
+        img = self._square()
+        full = BevelEmbossEffect(angle=135, size=4).render(img)
+        half = BevelEmbossEffect(angle=135, size=4, opacity=0.5).render(img)
+
+        assert 128 < half[27, 27, 0] < full[27, 27, 0]
+
+
 # Integration tests that require a running server would go here
 # These would be marked with @pytest.mark.integration
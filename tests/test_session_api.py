@@ -0,0 +1,146 @@
+"""Session API tests against the FastAPI app, without a browser or server."""
+
+import warnings
+
+import pytest
+from fastapi.exceptions import FastAPIDeprecationWarning
+from fastapi.testclient import TestClient
+
+from slopstag.app import create_api_app
+from slopstag.sessions import session_manager
+
+
+@pytest.fixture(scope="module")
+def client() -> TestClient:
+    """In-process client for the API application."""
+    return TestClient(create_api_app())
+
+
+class StubEditor:
+    """Stands in for the browser editor, answering method calls from a table."""
+
+    def __init__(self, results: dict):
+        self.results = results
+
+    async def run_method(self, name: str, *args):
+        result = self.results[name]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+@pytest.fixture
+def session():
+    """A registered session backed by a stub editor."""
+    document = {
+        "width": 4,
+        "height": 2,
+        "layers": [{"id": "a", "type": "raster", "imageData": "data:image/png;base64,"}],
+    }
+    session_manager.register("test-session", editor=StubEditor({"exportDocument": {"document": document}}))
+    yield document
+    session_manager.unregister("test-session")
+
+
+class TestDocumentExport:
+    """Tests for exporting a session's document."""
+
+    def test_export_document(self, client: TestClient, session: dict):
+        """The document is returned as JSON without deprecated response classes."""
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            response = client.get("/sessions/test-session/document/export")
+        assert not [w for w in caught if issubclass(w.category, FastAPIDeprecationWarning)]
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == {"document": session}
+
+    def test_export_unknown_session(self, client: TestClient):
+        """Unknown sessions are 404."""
+        assert client.get("/sessions/no_such_session/document/export").status_code == 404
+
+
+class TestMissingLayers:
+    """Tests for the status of errors the editor reports for missing layers."""
+
+    @pytest.fixture
+    def editor(self):
+        """A registered session whose editor reports every layer as missing."""
+        editor = StubEditor(
+            {
+                "getImageData": {"error": "Layer not found"},
+                "addLayerEffect": {"success": False, "error": "Layer not found: missing"},
+                "getLayerEffects": RuntimeError("Layer not found: missing"),
+            }
+        )
+        session_manager.register("test-session", editor=editor)
+        yield editor
+        session_manager.unregister("test-session")
+
+    def test_missing_layer_image_is_404(self, client: TestClient, editor: StubEditor):
+        """Fetching a missing layer's pixels is 404."""
+        response = client.get("/sessions/test-session/layers/missing")
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Layer not found"
+
+    def test_missing_layer_effect_is_404(self, client: TestClient, editor: StubEditor):
+        """Adding an effect to a missing layer is 404."""
+        response = client.post(
+            "/sessions/test-session/layers/missing/effects",
+            json={"effect_type": "dropShadow"},
+        )
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Layer not found: missing"
+
+    def test_missing_layer_exception_is_404(self, client: TestClient, editor: StubEditor):
+        """Missing layers reported by a failing editor call are 404 too."""
+        assert client.get("/sessions/test-session/layers/missing/effects").status_code == 404
+
+    def test_other_editor_errors_are_500(self, client: TestClient, editor: StubEditor):
+        """Editor errors other than missing items are server errors."""
+        editor.results["addLayerEffect"] = {"success": False, "error": "Canvas is busy"}
+        response = client.post(
+            "/sessions/test-session/layers/missing/effects",
+            json={"effect_type": "dropShadow"},
+        )
+        assert response.status_code == 500
+
+
+class TestRequestBodies:
+    """Tests for validation of session request bodies."""
+
+    def test_missing_field_is_422(self, client: TestClient):
+        """Bodies that do not match the request model are rejected."""
+        response = client.post("/sessions/no_such_session/command", json={"params": {}})
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"] == ["body", "command"]
+
+    def test_malformed_json_is_422(self, client: TestClient):
+        """Bodies that are not valid JSON are rejected."""
+        response = client.post(
+            "/sessions/no_such_session/tools/brush/execute",
+            content=b'{"action": "stroke",',
+            headers={"Content-Type": "application/json"},
+        )
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["type"] == "json_invalid"
+
+    def test_non_finite_numbers_are_accepted(self, client: TestClient):
+        """NaN and large integers parse like any JSON number and reach the handler."""
+        response = client.post(
+            "/sessions/no_such_session/command",
+            content=b'{"command": "noop", "params": {"a": NaN, "b": 18446744073709551616}}',
+            headers={"Content-Type": "application/json"},
+        )
+        assert response.status_code == 404
+
+    def test_body_schemas_are_documented(self, client: TestClient):
+        """Request models appear in the OpenAPI schema."""
+        schema = client.get("/openapi.json").json()
+        command = schema["paths"]["/sessions/{session_id}/command"]["post"]
+        assert command["requestBody"]["content"]["application/json"]["schema"] == {
+            "$ref": "#/components/schemas/CommandRequest"
+        }
+        for model in ("ToolExecuteRequest", "DocumentImportRequest", "ConfigSetRequest", "EffectAddRequest"):
+            assert model in schema["components"]["schemas"]